@@ -131,7 +131,7 @@ class TestTaskResultFunctions(TestCase):
         result = self.mock_task_instance(*self.test_args, **self.test_kwargs)
         assert COMPUTED_PRECIOUS_OBJECT == result
 
-    @ddt.data(*states.UNREADY_STATES)
+    @ddt.data(*sorted(states.UNREADY_STATES))
     def test_unready_tasks_exist_for_unready_states(self, task_state):
         self.mock_task_result.status = task_state
         self.mock_task_result.save()
@@ -142,7 +142,7 @@ class TestTaskResultFunctions(TestCase):
             ).exists()
         )
 
-    @ddt.data(*states.READY_STATES)
+    @ddt.data(*sorted(states.READY_STATES))
     def test_unready_tasks_dont_exist_for_ready_states(self, task_state):
         self.mock_task_result.status = task_state
         self.mock_task_result.save()
@@ -0,0 +1,26 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that serializes with orjson rather than the standard library json module.
+
+    Datetimes, and any other values orjson can't serialize natively (e.g. lazy translations), fall back to DRF's
+    JSONEncoder, and U+2028/U+2029 are escaped as DRF does, so that the output matches DRF's JSONRenderer for the
+    data these views return. Unlike DRF's renderer, any requested indent renders as two spaces, and NaN and infinity
+    render as null rather than raising.
+    """
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=options)
+        # Escape the line and paragraph separators that orjson leaves as is, to output JSON that is a strict
+        # javascript subset, as DRF's JSONRenderer does
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
@@ -105,6 +105,9 @@ class EnterpriseCatalogSerializer(serializers.ModelSerializer):
         ]
 
     def get_content_last_modified(self, obj):
+        if hasattr(obj, 'content_last_modified'):
+            # Annotated onto list querysets to avoid an aggregate query per catalog
+            return obj.content_last_modified
         return obj.content_metadata.aggregate(models.Max('modified')).get('modified__max')
 
     def create(self, validated_data):
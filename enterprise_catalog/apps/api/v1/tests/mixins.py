@@ -1,7 +1,11 @@
 """Broadly-useful mixins for use in automated tests."""
 
 import uuid
+from contextlib import contextmanager
+from unittest import mock
 
+from django.core.cache import cache
+from django.db import transaction
 from django.test.client import RequestFactory
 from edx_rest_framework_extensions.auth.jwt.cookies import jwt_cookie_name
 from edx_rest_framework_extensions.auth.jwt.tests.utils import (
@@ -72,11 +76,37 @@ class APITestMixin(JwtMixin, APITestCase):
     Mixin for functions shared between different API test classes
     """
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.enterprise_uuid = uuid.uuid4()
+        cls.enterprise_name = 'Test Enterprise'
+        cls.enterprise_slug = 'test-enterprise'
+
+    @classmethod
+    def patch_enterprise_api_client(cls):
+        """
+        Helper for patching the enterprise API client, through which enterprise customer details are fetched, for
+        every test in the class. Call from `setUpClass`; the mock is kept on `cls.mock_api_client`.
+        """
+        patcher = mock.patch('enterprise_catalog.apps.api_client.enterprise_cache.EnterpriseApiClient')
+        cls.mock_api_client = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
     def setUp(self):
         super().setUp()
-        self.enterprise_uuid = uuid.uuid4()
-        self.enterprise_name = 'Test Enterprise'
-        self.enterprise_slug = 'test-enterprise'
+        # Enterprise customer details are cached by enterprise uuid, which is shared by every test in the class
+        cache.clear()
+
+    @contextmanager
+    def atomic_subtest(self, **params):
+        """
+        Helper for running a subTest within a savepoint that is rolled back once it completes, so that each variant
+        of a test starts from the same database state.
+        """
+        with self.subTest(**params), transaction.atomic():
+            yield
+            transaction.set_rollback(True)
 
     def set_up_staff(self):
         """
@@ -91,6 +121,8 @@ class APITestMixin(JwtMixin, APITestCase):
         Helper for setting up tests as a catalog learner
         """
         self.user = UserFactory()
+        # Drop any user forced by `set_up_staff_user_fast` so the login below takes effect
+        self.client.force_authenticate(user=None)
         self.client.login(username=self.user.username, password=USER_PASSWORD)
         self.role = EnterpriseCatalogFeatureRole.objects.get(name=ENTERPRISE_CATALOG_LEARNER_ROLE)
         self.role_assignment = EnterpriseCatalogRoleAssignmentFactory(
@@ -100,6 +132,27 @@ class APITestMixin(JwtMixin, APITestCase):
         )
         self.set_jwt_cookie([(ENTERPRISE_CATALOG_LEARNER_ROLE, self.enterprise_uuid)])
 
+    @classmethod
+    def create_catalog_learner(cls):
+        """
+        Helper for creating a catalog learner once for a test class, to be logged in per test with
+        `log_in_catalog_learner`
+        """
+        cls.user = UserFactory()
+        cls.role = EnterpriseCatalogFeatureRole.objects.get(name=ENTERPRISE_CATALOG_LEARNER_ROLE)
+        cls.role_assignment = EnterpriseCatalogRoleAssignmentFactory(
+            role=cls.role,
+            user=cls.user,
+            enterprise_id=cls.enterprise_uuid
+        )
+
+    def log_in_catalog_learner(self):
+        """
+        Helper for logging in as the catalog learner created by `create_catalog_learner`
+        """
+        self.client.login(username=self.user.username, password=USER_PASSWORD)
+        self.set_jwt_cookie([(ENTERPRISE_CATALOG_LEARNER_ROLE, self.enterprise_uuid)])
+
     def set_up_staff_user(self):
         """
         Helper for setting up tests with a staff user object.
@@ -107,11 +160,21 @@ class APITestMixin(JwtMixin, APITestCase):
         self.user = UserFactory(is_staff=True)
         self.client.login(username=self.user.username, password=USER_PASSWORD)
 
+    def set_up_staff_user_fast(self):
+        """
+        Helper for setting up tests with a staff user object, authenticating the client directly rather than
+        logging in, for tests that don't need a real session.
+        """
+        self.user = UserFactory(is_staff=True)
+        self.client.force_authenticate(user=self.user)
+
     def set_up_superuser(self):
         """
         Helper for logging in as a superuser
         """
         superuser = UserFactory(is_superuser=True)
+        # Drop any user forced by `set_up_staff_user_fast` so the login below takes effect
+        self.client.force_authenticate(user=None)
         self.client.login(username=superuser.username, password=USER_PASSWORD)
 
     def assign_catalog_admin_feature_role(self, user=None, enterprise_uuids=None):
@@ -156,6 +219,20 @@ class APITestMixin(JwtMixin, APITestCase):
         response = self.client.get(url)
         self.assertEqual(response.json()['contains_content_items'], expected_value)
 
+    def mock_algolia_search(self, algolia_client_path, *search_results):
+        """
+        Helper to patch the Algolia client initializer at the given import path, with each search against the mocked
+        index returning the next of the given search results. A single search result is returned by every search.
+
+        Returns:
+            A `mock.patch` context manager that yields the mocked client initializer.
+        """
+        if len(search_results) == 1:
+            search_mock = {'return_value.algolia_index.search.return_value': search_results[0]}
+        else:
+            search_mock = {'return_value.algolia_index.search.side_effect': search_results}
+        return mock.patch(algolia_client_path, **search_mock)
+
     def add_metadata_to_catalog(self, catalog, metadata):
         """
         Adds the given pieces of metadata to a catalog
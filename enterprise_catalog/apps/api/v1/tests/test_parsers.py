@@ -0,0 +1,26 @@
+from io import BytesIO
+
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ParseError
+
+from enterprise_catalog.apps.api.v1.parsers import ORJSONParser
+
+
+class ORJSONParserTests(SimpleTestCase):
+    """
+    Tests for the orjson backed JSON parser
+    """
+
+    def test_parse(self):
+        """
+        Test that a JSON body is parsed into python data
+        """
+        stream = BytesIO(b'{"content_keys": ["key1", "key2"]}')
+        assert ORJSONParser().parse(stream) == {'content_keys': ['key1', 'key2']}
+
+    def test_parse_invalid_json(self):
+        """
+        Test that an invalid JSON body raises a ParseError
+        """
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(BytesIO(b'{"content_keys": '))
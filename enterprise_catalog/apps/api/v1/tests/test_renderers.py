@@ -0,0 +1,51 @@
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from enterprise_catalog.apps.api.v1.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """
+    Tests for the orjson backed JSON renderer
+    """
+
+    def test_render_matches_json_renderer(self):
+        """
+        Test that the renderer produces the same output as DRF's JSONRenderer for the kinds of data the views return,
+        including values orjson doesn't serialize natively
+        """
+        data = {
+            'uuid': uuid.UUID(int=1),
+            'modified': datetime(2022, 1, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+            'title': gettext_lazy('Catalog title'),
+            'description': 'Line\u2028separated\u2029paragraphs',
+            'price': Decimal('10.50'),
+            'catalog_uuids_by_catalog_query_id': {1: ['catalog'], None: []},
+            'content_keys': ('key1', 'key2'),
+        }
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_render_escapes_line_and_paragraph_separators(self):
+        """
+        Test that U+2028 and U+2029 are escaped, as orjson otherwise leaves them as is
+        """
+        rendered = ORJSONRenderer().render({'description': 'Line\u2028separated\u2029paragraphs'})
+        assert rendered == b'{"description":"Line\\u2028separated\\u2029paragraphs"}'
+
+    def test_render_none(self):
+        """
+        Test that rendering no data produces an empty body
+        """
+        assert ORJSONRenderer().render(None) == b''
+
+    def test_render_indent(self):
+        """
+        Test that an indent requested through the accepted media type is applied
+        """
+        rendered = ORJSONRenderer().render({'key': 'value'}, 'application/json; indent=2')
+        assert rendered == b'{\n  "key": "value"\n}'
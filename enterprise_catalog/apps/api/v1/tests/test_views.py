@@ -1,21 +1,25 @@
-import copy
+import csv
+import itertools
 import json
 import uuid
-from collections import OrderedDict
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from io import StringIO
 from operator import itemgetter
 from unittest import mock
 
 import ddt
-import pytz
 from django.conf import settings
 from django.db import IntegrityError
+from django.urls import reverse_lazy
 from django.utils.text import slugify
 from rest_framework import status
 from rest_framework.reverse import reverse
-from rest_framework.settings import api_settings
+from rest_framework.test import APISimpleTestCase
 from six.moves.urllib.parse import quote_plus
 
+from enterprise_catalog.apps.api.v1.pagination import (
+    PageNumberWithSizePagination,
+)
 from enterprise_catalog.apps.api.v1.tests.mixins import APITestMixin
 from enterprise_catalog.apps.api.v1.utils import is_any_course_run_active
 from enterprise_catalog.apps.catalog.constants import (
@@ -24,7 +28,6 @@ from enterprise_catalog.apps.catalog.constants import (
     PROGRAM,
 )
 from enterprise_catalog.apps.catalog.models import (
-    CatalogQuery,
     ContentMetadata,
     ContentMetadataToQueries,
     EnterpriseCatalog,
@@ -34,365 +37,383 @@ from enterprise_catalog.apps.catalog.tests.factories import (
     ContentMetadataFactory,
     EnterpriseCatalogFactory,
 )
-from enterprise_catalog.apps.catalog.utils import get_parent_content_key
+from enterprise_catalog.apps.catalog.utils import (
+    get_parent_content_key,
+    localized_utcnow,
+)
 
 
-@ddt.ddt
-class EnterpriseCatalogDefaultCatalogResultsTests(APITestMixin):
+_test_uuids = itertools.count(1)
+
+
+def _test_uuid():
     """
-    Tests for the DefaultCatalogResultsView class
+    Returns a uuid that is unique within the test run, without the os.urandom read behind each uuid.uuid4().
     """
-    mock_algolia_hits = {'hits': [{
-        'aggregation_key': 'course:MITx+18.01.2x',
-        'key': 'MITx+18.01.2x',
-        'language': 'English',
-        'level_type': 'Intermediate',
-        'content_type': 'course',
-        'partners': [
-            {'name': 'Massachusetts Institute of Technology',
-             'logo_image_url': 'https://edx.org/image.png'}
-        ],
-        'programs': ['Professional Certificate'],
-        'program_titles': ['Totally Awesome Program'],
-        'short_description': 'description',
-        'subjects': ['Math'],
-        'skills': [{
-            'name': 'Probability And Statistics',
-            'description': 'description'
-        }, {
-            'name': 'Engineering Design Process',
-            'description': 'description'
-        }],
-        'title': 'Calculus 1B: Integration',
-        'marketing_url': 'edx.org/foo-bar',
-        'first_enrollable_paid_seat_price': 100,
-        'advertised_course_run': {
-            'key': 'MITx/18.01.2x/3T2015',
-            'pacing_type': 'instructor_paced',
-            'start': '2015-09-08T00:00:00Z',
-            'end': '2015-09-08T00:00:01Z',
-            'upgrade_deadline': 32503680000.0,
-        },
-        'objectID': 'course-3543aa4e-3c64-4d9a-a343-5d5eda1dacf8-catalog-query-uuids-0'
+    return uuid.UUID(int=next(_test_uuids))
+
+
+# Never handed out by _test_uuid, so it only ever appears in the url templates below
+_URL_PLACEHOLDER_UUID = str(uuid.UUID(int=0))
+
+
+def _url_template(viewname, kwarg='uuid'):
+    """
+    Resolves the named url once, with a placeholder in place of the uuid that `_url_for` swaps out.
+    """
+    return reverse(viewname, kwargs={kwarg: _URL_PLACEHOLDER_UUID})
+
+
+def _url_for(url_template, url_uuid):
+    """
+    Returns the url from `_url_template` for the given uuid, without walking the url resolver again.
+    """
+    return url_template.replace(_URL_PLACEHOLDER_UUID, str(url_uuid))
+
+
+# Modified time of the mocked enterprise customer, which predates any catalog content created by the tests
+_ENTERPRISE_CUSTOMER_MODIFIED = str(datetime(2022, 1, 1, tzinfo=timezone.utc))
+
+_COURSE_ALGOLIA_HIT = {
+    'aggregation_key': 'course:MITx+18.01.2x',
+    'key': 'MITx+18.01.2x',
+    'language': 'English',
+    'level_type': 'Intermediate',
+    'content_type': 'course',
+    'partners': [
+        {'name': 'Massachusetts Institute of Technology',
+         'logo_image_url': 'https://edx.org/image.png'}
+    ],
+    'programs': ['Professional Certificate'],
+    'program_titles': ['Totally Awesome Program'],
+    'short_description': 'description',
+    'subjects': ['Math'],
+    'skills': [{
+        'name': 'Probability And Statistics',
+        'description': 'description'
+    }, {
+        'name': 'Engineering Design Process',
+        'description': 'description'
+    }],
+    'title': 'Calculus 1B: Integration',
+    'marketing_url': 'edx.org/foo-bar',
+    'first_enrollable_paid_seat_price': 100,
+    'advertised_course_run': {
+        'key': 'MITx/18.01.2x/3T2015',
+        'pacing_type': 'instructor_paced',
+        'start': '2015-09-08T00:00:00Z',
+        'end': '2015-09-08T00:00:01Z',
+        'upgrade_deadline': 32503680000.0,
     },
-        {
+    'objectID': 'course-3543aa4e-3c64-4d9a-a343-5d5eda1dacf8-catalog-query-uuids-0'
+}
+
+# Sparse hits that follow the course hit in every mocked search
+_MINIMAL_ALGOLIA_HITS = [
+    {
         'aggregation_key': 'course:MITx+19',
         'key': 'MITx+19',
         'language': 'English',
         'level_type': 'Intermediate',
         'objectID': 'course-3543aa4e-3c64-4d9a-a343-5d5eda1dacf9-catalog-query-uuids-0'
     },
-        {
+    {
         'aggregation_key': 'course:MITx+20',
         'language': 'English',
         'level_type': 'Intermediate',
         'objectID': 'course-3543aa4e-3c64-4d9a-a343-5d5eda1dacf7-catalog-query-uuids-0'
-    }
-    ]}
+    },
+]
+
+# The course hit with the effort, outcome and prerequisite fields read by the CSV and workbook exports
+_EXPORT_COURSE_ALGOLIA_HIT = {
+    **_COURSE_ALGOLIA_HIT,
+    'advertised_course_run': {
+        **_COURSE_ALGOLIA_HIT['advertised_course_run'],
+        'max_effort': 10,
+        'min_effort': 1,
+        'weeks_to_complete': 1,
+    },
+    'outcome': '<p>learn</p>',
+    'prerequisites_raw': '<p>interest</p>',
+}
 
-    def setUp(self):
-        super().setUp()
-        self.set_up_staff_user()
+_DEFAULT_CATALOG_RESULTS_ALGOLIA_HITS = {'hits': [_COURSE_ALGOLIA_HIT, *_MINIMAL_ALGOLIA_HITS]}
 
-    def _get_contains_content_base_url(self):
-        """
-        Helper to construct the base url for the contains_content_items endpoint
-        """
-        return reverse('api:v1:default-course-set')
+_CSV_DATA_ALGOLIA_HITS = {'hits': [_EXPORT_COURSE_ALGOLIA_HIT, *_MINIMAL_ALGOLIA_HITS]}
+
+_WORKBOOK_ALGOLIA_HITS = {'hits': [
+    {
+        **_EXPORT_COURSE_ALGOLIA_HIT,
+        'course_runs': [_EXPORT_COURSE_ALGOLIA_HIT['advertised_course_run']],
+    },
+    *_MINIMAL_ALGOLIA_HITS,
+]}
+
+_EMPTY_ALGOLIA_HITS = {'hits': []}
+
+_EXPECTED_CSV_HEADER = (
+    'Title',
+    'Partner Name',
+    'Start',
+    'End',
+    'Verified Upgrade Deadline',
+    'Program Type',
+    'Program Name',
+    'Pacing',
+    'Level',
+    'Price',
+    'Language',
+    'URL',
+    'Short Description',
+    'Subjects',
+    'Key',
+    'Short Key',
+    'Skills',
+    'Min Effort',
+    'Max Effort',
+    'Length',
+    'What You’ll Learn',
+    'Pre-requisites',
+)
+
+# The CSV row expected for the first hit of `_CSV_DATA_ALGOLIA_HITS`
+_EXPECTED_CSV_ROW = {
+    'Title': 'Calculus 1B: Integration',
+    'Partner Name': 'Massachusetts Institute of Technology',
+    'Start': '2015-09-08',
+    'End': '2015-09-08',
+    'Verified Upgrade Deadline': '3000-01-01',
+    'Program Type': 'Professional Certificate',
+    'Program Name': 'Totally Awesome Program',
+    'Pacing': 'instructor_paced',
+    'Level': 'Intermediate',
+    'Price': 100,
+    'Language': 'English',
+    'URL': 'edx.org/foo-bar',
+    'Short Description': 'description',
+    'Subjects': 'Math',
+    'Key': 'MITx/18.01.2x/3T2015',
+    'Short Key': 'course:MITx+18.01.2x',
+    'Skills': 'Probability And Statistics, Engineering Design Process',
+    'Min Effort': 1,
+    'Max Effort': 10,
+    'Length': 1,
+    'What You’ll Learn': 'learn',
+    'Pre-requisites': 'interest',
+}
+
+
+def _expected_csv(rows):
+    """
+    Helper to build the expected CSV data for the given rows, each a dict keyed by column header.
+    """
+    with StringIO() as file:
+        writer = csv.writer(file)
+        writer.writerow(_EXPECTED_CSV_HEADER)
+        for row in rows:
+            writer.writerow([row[column] for column in _EXPECTED_CSV_HEADER])
+        return file.getvalue()
+
+
+class EnterpriseCatalogDefaultCatalogResultsTests(APITestMixin):
+    """
+    Tests for the DefaultCatalogResultsView class
+    """
+    algolia_client_path = 'enterprise_catalog.apps.api.v1.views.default_catalog_results.get_initialized_algolia_client'
+    url = reverse_lazy('api:v1:default-course-set')
 
-    def test_facet_validation(self):
+    @classmethod
+    def mock_algolia_hits(cls):
         """
-        Tests that the view validates Algolia facets provided by query params
+        Returns the Algolia search payload shared by every test in this class.
         """
-        url = self._get_contains_content_base_url()
-        invalid_facets = 'invalid_facet=wrong&enterprise_catalog_query_titles=ayylmao'
-        response = self.client.get(f'{url}?{invalid_facets}')
-        assert response.status_code == 400
-        assert response.json() == {'Error': "invalid facet(s): ['invalid_facet'] provided."}
+        return _DEFAULT_CATALOG_RESULTS_ALGOLIA_HITS
+
+    def setUp(self):
+        super().setUp()
+        self.set_up_staff_user_fast()
 
-    @mock.patch('enterprise_catalog.apps.api.v1.views.default_catalog_results.get_initialized_algolia_client')
-    def test_valid_facet_validation(self, mock_algolia_client):
+    def test_valid_facet_validation(self):
         """
         Tests a successful request with facets.
         """
-        mock_algolia_client.return_value.algolia_index.search.side_effect = [self.mock_algolia_hits, {'hits': []}]
-        url = self._get_contains_content_base_url()
         facets = 'enterprise_catalog_query_titles=foo&content_type=course'
-        response = self.client.get(f'{url}?{facets}')
+        with self.mock_algolia_search(self.algolia_client_path, self.mock_algolia_hits(), _EMPTY_ALGOLIA_HITS):
+            response = self.client.get(f'{self.url}?{facets}')
         assert response.status_code == 200
 
-    def test_required_param_validation(self):
-        """
-        Tests that the view requires a provided catalog
-        """
-        url = self._get_contains_content_base_url()
-        invalid_facets = 'bad=ayylmao'
-        response = self.client.get(f'{url}?{invalid_facets}')
-        assert response.status_code == 400
-        assert response.json() == [
-            'You must provide at least one of the following query parameters: enterprise_catalog_query_titles.'
-        ]
-
 
-@ddt.ddt
 class EnterpriseCatalogCRUDViewSetTests(APITestMixin):
     """
     Tests for the EnterpriseCatalogCRUDViewSet
     """
 
-    def setUp(self):
-        super().setUp()
-        self.set_up_staff()
-        self.enterprise_catalog = EnterpriseCatalogFactory(
-            enterprise_uuid=self.enterprise_uuid,
-            enterprise_name=self.enterprise_name,
+    list_url = reverse_lazy('api:v1:enterprise-catalog-list')
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.enterprise_catalog = EnterpriseCatalogFactory(
+            enterprise_uuid=cls.enterprise_uuid,
+            enterprise_name=cls.enterprise_name,
         )
-        self.new_catalog_uuid = uuid.uuid4()
-        self.new_catalog_data = {
-            'uuid': self.new_catalog_uuid,
+        cls.detail_url = reverse('api:v1:enterprise-catalog-detail', kwargs={'uuid': cls.enterprise_catalog.uuid})
+        cls.new_catalog_uuid = _test_uuid()
+        cls.new_catalog_data = {
+            'uuid': cls.new_catalog_uuid,
             'title': 'Test Title',
-            'enterprise_customer': self.enterprise_uuid,
-            'enterprise_customer_name': self.enterprise_name,
-            'enabled_course_modes': '["verified"]',
+            'enterprise_customer': cls.enterprise_uuid,
+            'enterprise_customer_name': cls.enterprise_name,
+            'enabled_course_modes': ['verified'],
             'publish_audit_enrollment_urls': True,
-            'content_filter': '{"content_type":"course"}',
+            'content_filter': {'content_type': 'course'},
         }
+        # Encoded once for the tests that send the new catalog as a request body
+        cls.new_catalog_body = json.dumps(cls.new_catalog_data, default=str)
+
+    def setUp(self):
+        super().setUp()
+        self.set_up_staff()
 
     def _assert_correct_new_catalog_data(self, catalog_uuid):
         """
         Helper for verifying the data for a created/updated catalog
         """
-        new_enterprise_catalog = EnterpriseCatalog.objects.get(uuid=catalog_uuid)
+        new_enterprise_catalog = EnterpriseCatalog.objects.select_related('catalog_query').get(uuid=catalog_uuid)
         self.assertEqual(new_enterprise_catalog.title, self.new_catalog_data['title'])
         self.assertEqual(new_enterprise_catalog.enabled_course_modes, ['verified'])
         self.assertEqual(
             new_enterprise_catalog.publish_audit_enrollment_urls,
             self.new_catalog_data['publish_audit_enrollment_urls'],
         )
-        self.assertEqual(
-            new_enterprise_catalog.catalog_query.content_filter,
-            OrderedDict([('content_type', 'course')]),
-        )
-
-    def test_detail_unauthorized_catalog_learner(self):
-        """
-        Verify the viewset rejects catalog learners for the detail route
-        """
-        self.set_up_catalog_learner()
-        url = reverse('api:v1:enterprise-catalog-detail', kwargs={'uuid': self.enterprise_catalog.uuid})
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertDictEqual(new_enterprise_catalog.catalog_query.content_filter, {'content_type': 'course'})
 
-    def test_patch_unauthorized_catalog_learner(self):
+    def _assert_requests_forbidden(self, detail_url, post_data):
         """
-        Verify the viewset rejects patch for catalog learners
+        Helper for verifying that each request the viewset routes is rejected, for the catalog at the given detail url
+        and when posting the given data.
         """
-        self.set_up_catalog_learner()
-        url = reverse('api:v1:enterprise-catalog-detail', kwargs={'uuid': self.enterprise_catalog.uuid})
-        patch_data = {'title': 'Patch title'}
-        response = self.client.patch(url, patch_data)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-
-    def test_put_unauthorized_catalog_learner(self):
-        """
-        Verify the viewset rejects put for catalog learners
-        """
-        self.set_up_catalog_learner()
-        url = reverse('api:v1:enterprise-catalog-detail', kwargs={'uuid': self.enterprise_catalog.uuid})
-        response = self.client.put(url, self.new_catalog_data)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        requests = (
+            ('get', detail_url, None),
+            ('patch', detail_url, {'title': 'Patch title'}),
+            ('put', detail_url, self.new_catalog_data),
+            ('post', self.list_url, post_data),
+        )
+        self.client.default_format = 'json'
+        for http_method, url, data in requests:
+            with self.atomic_subtest(http_method=http_method):
+                response = getattr(self.client, http_method)(url, data)
+                self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
-    def test_post_unauthorized_catalog_learner(self):
+    def test_unauthorized_catalog_learner(self):
         """
-        Verify the viewset rejects post for catalog learners
+        Verify the viewset rejects catalog learners
         """
         self.set_up_catalog_learner()
-        url = reverse('api:v1:enterprise-catalog-list')
-        response = self.client.post(url, self.new_catalog_data)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-
-    @ddt.data(
-        (False),
-        (True),
-    )
-    def test_detail(self, is_implicit_check):
-        """
-        Verify the viewset returns the details for a single enterprise catalog
-        """
-        if is_implicit_check:
-            self.remove_role_assignments()
-
-        url = reverse('api:v1:enterprise-catalog-detail', kwargs={'uuid': self.enterprise_catalog.uuid})
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        data = response.data
-        self.assertEqual(uuid.UUID(data['uuid']), self.enterprise_catalog.uuid)
-        self.assertEqual(data['title'], self.enterprise_catalog.title)
-        self.assertEqual(uuid.UUID(data['enterprise_customer']), self.enterprise_catalog.enterprise_uuid)
+        self._assert_requests_forbidden(self.detail_url, self.new_catalog_data)
 
-    def test_detail_unauthorized_non_catalog_admin(self):
+    def test_unauthorized_non_catalog_admin(self):
         """
-        Verify the viewset rejects users that are not catalog admins for the detail route
+        Verify the viewset rejects users that are not catalog admins
         """
         self.set_up_invalid_jwt_role()
         self.remove_role_assignments()
-        url = reverse('api:v1:enterprise-catalog-detail', kwargs={'uuid': self.enterprise_catalog.uuid})
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self._assert_requests_forbidden(self.detail_url, self.new_catalog_data)
 
-    def test_detail_unauthorized_incorrect_jwt_context(self):
+    def test_unauthorized_incorrect_jwt_context(self):
         """
         Verify the viewset rejects users that are catalog admins with an invalid
-        context (i.e., enterprise uuid) for the detail route.
+        context (i.e., enterprise uuid)
         """
         enterprise_catalog = EnterpriseCatalogFactory()
         self.remove_role_assignments()
-        url = reverse('api:v1:enterprise-catalog-detail', kwargs={'uuid': enterprise_catalog.uuid})
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-
-    @ddt.data(
-        (False),
-        (True),
-    )
-    def test_patch(self, is_implicit_check):
-        """
-        Verify the viewset handles patching an enterprise catalog
-        """
-        if is_implicit_check:
-            self.remove_role_assignments()
-
-        url = reverse('api:v1:enterprise-catalog-detail', kwargs={'uuid': self.enterprise_catalog.uuid})
-        patch_data = {'title': 'Patch title'}
-        response = self.client.patch(url, patch_data)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Verify that only the data we specifically patched changed
-        self.assertEqual(response.data['title'], patch_data['title'])
-        patched_catalog = EnterpriseCatalog.objects.get(uuid=self.enterprise_catalog.uuid)
-        self.assertEqual(patched_catalog.catalog_query, self.enterprise_catalog.catalog_query)
-        self.assertEqual(patched_catalog.enterprise_uuid, self.enterprise_catalog.enterprise_uuid)
-        self.assertEqual(patched_catalog.enabled_course_modes, self.enterprise_catalog.enabled_course_modes)
-        self.assertEqual(
-            patched_catalog.publish_audit_enrollment_urls,
-            self.enterprise_catalog.publish_audit_enrollment_urls,
+        self._assert_requests_forbidden(
+            reverse('api:v1:enterprise-catalog-detail', kwargs={'uuid': enterprise_catalog.uuid}),
+            {**self.new_catalog_data, 'enterprise_customer': _test_uuid()},
         )
 
-    def test_patch_unauthorized_non_catalog_admin(self):
+    def test_detail(self):
         """
-        Verify the viewset rejects patch for users that are not catalog admins
+        Verify the viewset returns the details for a single enterprise catalog
         """
-        self.set_up_invalid_jwt_role()
-        self.remove_role_assignments()
-        url = reverse('api:v1:enterprise-catalog-detail', kwargs={'uuid': self.enterprise_catalog.uuid})
-        patch_data = {'title': 'Patch title'}
-        response = self.client.patch(url, patch_data)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        for is_implicit_check in (False, True):
+            with self.atomic_subtest(is_implicit_check=is_implicit_check):
+                if is_implicit_check:
+                    self.remove_role_assignments()
 
-    def test_patch_unauthorized_incorrect_jwt_context(self):
+                response = self.client.get(self.detail_url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                data = response.data
+                self.assertEqual(uuid.UUID(data['uuid']), self.enterprise_catalog.uuid)
+                self.assertEqual(data['title'], self.enterprise_catalog.title)
+                self.assertEqual(uuid.UUID(data['enterprise_customer']), self.enterprise_catalog.enterprise_uuid)
+
+    def test_patch(self):
         """
-        Verify the viewset rejects patch for users that are catalog admins with an invalid
-        context (i.e., enterprise uuid)
+        Verify the viewset handles patching an enterprise catalog
         """
-        enterprise_catalog = EnterpriseCatalogFactory()
-        self.remove_role_assignments()
-        url = reverse('api:v1:enterprise-catalog-detail', kwargs={'uuid': enterprise_catalog.uuid})
-        patch_data = {'title': 'Patch title'}
-        response = self.client.patch(url, patch_data)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        for is_implicit_check in (False, True):
+            with self.atomic_subtest(is_implicit_check=is_implicit_check):
+                if is_implicit_check:
+                    self.remove_role_assignments()
+
+                patch_data = {'title': 'Patch title'}
+                response = self.client.patch(self.detail_url, patch_data)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                # Verify that only the data we specifically patched changed
+                self.assertEqual(response.data['title'], patch_data['title'])
+                patched_catalog = EnterpriseCatalog.objects.only(
+                    'catalog_query',
+                    'enterprise_uuid',
+                    'enabled_course_modes',
+                    'publish_audit_enrollment_urls',
+                ).get(uuid=self.enterprise_catalog.uuid)
+                self.assertEqual(patched_catalog.catalog_query_id, self.enterprise_catalog.catalog_query_id)
+                self.assertEqual(patched_catalog.enterprise_uuid, self.enterprise_catalog.enterprise_uuid)
+                self.assertEqual(patched_catalog.enabled_course_modes, self.enterprise_catalog.enabled_course_modes)
+                self.assertEqual(
+                    patched_catalog.publish_audit_enrollment_urls,
+                    self.enterprise_catalog.publish_audit_enrollment_urls,
+                )
 
-    @ddt.data(
-        (False),
-        (True),
-    )
-    def test_put(self, is_implicit_check):
+    def test_put(self):
         """
         Verify the viewset handles replacing an enterprise catalog
         """
-        if is_implicit_check:
-            self.remove_role_assignments()
+        for is_implicit_check in (False, True):
+            with self.atomic_subtest(is_implicit_check=is_implicit_check):
+                if is_implicit_check:
+                    self.remove_role_assignments()
 
-        url = reverse('api:v1:enterprise-catalog-detail', kwargs={'uuid': self.enterprise_catalog.uuid})
-        response = self.client.put(url, self.new_catalog_data)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self._assert_correct_new_catalog_data(self.enterprise_catalog.uuid)  # The UUID should not have changed
+                response = self.client.put(self.detail_url, self.new_catalog_body, content_type='application/json')
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self._assert_correct_new_catalog_data(self.enterprise_catalog.uuid)  # The UUID should not have changed
 
-    def test_put_unauthorized_non_catalog_admin(self):
-        """
-        Verify the viewset rejects put for users that are not catalog admins
-        """
-        self.set_up_invalid_jwt_role()
-        self.remove_role_assignments()
-        url = reverse('api:v1:enterprise-catalog-detail', kwargs={'uuid': self.enterprise_catalog.uuid})
-        response = self.client.put(url, self.new_catalog_data)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-
-    def test_put_unauthorized_incorrect_jwt_context(self):
-        """
-        Verify the viewset rejects put for users that are catalog admins with an invalid
-        context (i.e., enterprise uuid)
-        """
-        enterprise_catalog = EnterpriseCatalogFactory()
-        self.remove_role_assignments()
-        url = reverse('api:v1:enterprise-catalog-detail', kwargs={'uuid': enterprise_catalog.uuid})
-        response = self.client.put(url, self.new_catalog_data)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-
-    @ddt.data(
-        (False),
-        (True),
-    )
-    def test_post(self, is_implicit_check):
+    def test_post(self):
         """
         Verify the viewset handles creating an enterprise catalog
         """
-        if is_implicit_check:
-            self.remove_role_assignments()
+        for is_implicit_check in (False, True):
+            with self.atomic_subtest(is_implicit_check=is_implicit_check):
+                if is_implicit_check:
+                    self.remove_role_assignments()
 
-        url = reverse('api:v1:enterprise-catalog-list')
-        response = self.client.post(url, self.new_catalog_data)
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self._assert_correct_new_catalog_data(self.new_catalog_uuid)
+                response = self.client.post(self.list_url, self.new_catalog_body, content_type='application/json')
+                self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+                self._assert_correct_new_catalog_data(self.new_catalog_uuid)
 
     def test_post_integrity_error(self):
         """
         Verify the viewset raises error when creating a duplicate enterprise catalog
         """
-        url = reverse('api:v1:enterprise-catalog-list')
-        self.client.post(url, self.new_catalog_data)
+        self.client.post(self.list_url, self.new_catalog_body, content_type='application/json')
         with self.assertRaises(IntegrityError):
-            self.client.post(url, self.new_catalog_data)
+            self.client.post(self.list_url, self.new_catalog_body, content_type='application/json')
         # Note: we're hitting the endpoint twice here, but this task should
         # only be run once, as we should error from an integrity error the
         # second time through
 
-    def test_post_unauthorized_non_catalog_admin(self):
-        """
-        Verify the viewset rejects post for users that are not catalog admins
-        """
-        self.set_up_invalid_jwt_role()
-        self.remove_role_assignments()
-        url = reverse('api:v1:enterprise-catalog-list')
-        response = self.client.post(url, self.new_catalog_data)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-
-    def test_post_unauthorized_incorrect_jwt_context(self):
-        """
-        Verify the viewset rejects post for users that are catalog admins with an invalid
-        context (i.e., enterprise uuid)
-        """
-        catalog_data = {
-            'uuid': self.new_catalog_uuid,
-            'title': 'Test Title',
-            'enterprise_customer': uuid.uuid4(),
-            'enabled_course_modes': '["verified"]',
-            'publish_audit_enrollment_urls': True,
-            'content_filter': '{"content_type":"course"}',
-        }
-        self.remove_role_assignments()
-        url = reverse('api:v1:enterprise-catalog-list')
-        response = self.client.post(url, catalog_data)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-
 
 @ddt.ddt
 class EnterpriseCatalogCRUDViewSetListTests(APITestMixin):
@@ -400,19 +421,28 @@ class EnterpriseCatalogCRUDViewSetListTests(APITestMixin):
     Tests for the EnterpriseCatalogCRUDViewSet list endpoint.
     """
 
+    list_url = reverse_lazy('api:v1:enterprise-catalog-list')
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.enterprise_catalog = EnterpriseCatalogFactory(enterprise_uuid=cls.enterprise_uuid)
+
     def setUp(self):
         super().setUp()
-        self.set_up_staff_user()
-        self.enterprise_catalog = EnterpriseCatalogFactory(enterprise_uuid=self.enterprise_uuid)
+        self.set_up_staff_user_fast()
+
+    # Queries made by a catalog admin's request to the list endpoint: fetching their role assignments, and a count
+    # plus a single page query for the catalogs themselves, regardless of how many are returned.
+    list_num_queries = 3
 
     def test_list_for_superusers(self):
         """
         Verify the viewset returns a list of all enterprise catalogs for superusers
         """
         self.set_up_superuser()
-        url = reverse('api:v1:enterprise-catalog-list')
         second_enterprise_catalog = EnterpriseCatalogFactory()
-        response = self.client.get(url)
+        response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 2)
         results = response.data['results']
@@ -424,98 +454,150 @@ class EnterpriseCatalogCRUDViewSetListTests(APITestMixin):
         Verify the viewset returns an empty list for users that are staff but not catalog admins.
         """
         self.set_up_invalid_jwt_role()
-        url = reverse('api:v1:enterprise-catalog-list')
-        response = self.client.get(url)
+        response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 0)
 
-    @ddt.data(
-        False,
-        True,
-    )
-    def test_one_catalog_for_catalog_admins(self, is_role_assigned_via_jwt):
+    def test_one_catalog_for_catalog_admins(self):
         """
         Verify the viewset returns a single catalog (when multiple exist) for catalog admins of a certain enterprise.
         """
-        if is_role_assigned_via_jwt:
-            self.assign_catalog_admin_jwt_role()
-        else:
-            self.assign_catalog_admin_feature_role()
+        for is_role_assigned_via_jwt in (False, True):
+            with self.atomic_subtest(is_role_assigned_via_jwt=is_role_assigned_via_jwt):
+                if is_role_assigned_via_jwt:
+                    self.assign_catalog_admin_jwt_role()
+                else:
+                    self.assign_catalog_admin_feature_role()
 
-        # create an additional catalog from a different enterprise,
-        # and make sure we don't see it in the response results.
-        EnterpriseCatalogFactory(enterprise_uuid=uuid.uuid4())
+                # create an additional catalog from a different enterprise,
+                # and make sure we don't see it in the response results.
+                EnterpriseCatalogFactory(enterprise_uuid=_test_uuid())
 
-        url = reverse('api:v1:enterprise-catalog-list')
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 1)
-        results = response.data['results']
-        self.assertEqual(uuid.UUID(results[0]['uuid']), self.enterprise_catalog.uuid)
+                response = self.client.get(self.list_url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data['count'], 1)
+                results = response.data['results']
+                self.assertEqual(uuid.UUID(results[0]['uuid']), self.enterprise_catalog.uuid)
 
-    @ddt.data(
-        False,
-        True,
-    )
-    def test_multiple_catalogs_for_catalog_admins(self, is_role_assigned_via_jwt):
+    def test_multiple_catalogs_for_catalog_admins(self):
         """
         Verify the viewset returns multiple catalogs for catalog admins of two different enterprises.
         """
-        second_enterprise_catalog = EnterpriseCatalogFactory(enterprise_uuid=uuid.uuid4())
-
-        if is_role_assigned_via_jwt:
-            self.assign_catalog_admin_jwt_role(
-                self.enterprise_uuid,
-                second_enterprise_catalog.enterprise_uuid,
-            )
-        else:
-            self.assign_catalog_admin_feature_role(enterprise_uuids=[
-                self.enterprise_uuid,
-                second_enterprise_catalog.enterprise_uuid,
-            ])
+        for is_role_assigned_via_jwt in (False, True):
+            with self.atomic_subtest(is_role_assigned_via_jwt=is_role_assigned_via_jwt):
+                second_enterprise_catalog = EnterpriseCatalogFactory(enterprise_uuid=_test_uuid())
 
-        url = reverse('api:v1:enterprise-catalog-list')
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 2)
-        results = response.data['results']
-        self.assertEqual(uuid.UUID(results[0]['uuid']), self.enterprise_catalog.uuid)
-        self.assertEqual(uuid.UUID(results[1]['uuid']), second_enterprise_catalog.uuid)
+                if is_role_assigned_via_jwt:
+                    self.assign_catalog_admin_jwt_role(
+                        self.enterprise_uuid,
+                        second_enterprise_catalog.enterprise_uuid,
+                    )
+                else:
+                    self.assign_catalog_admin_feature_role(enterprise_uuids=[
+                        self.enterprise_uuid,
+                        second_enterprise_catalog.enterprise_uuid,
+                    ])
+
+                with self.assertNumQueries(self.list_num_queries):
+                    response = self.client.get(self.list_url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data['count'], 2)
+                results = response.data['results']
+                self.assertEqual(uuid.UUID(results[0]['uuid']), self.enterprise_catalog.uuid)
+                self.assertEqual(uuid.UUID(results[1]['uuid']), second_enterprise_catalog.uuid)
+
+    def test_every_catalog_for_catalog_admins(self):
+        """
+        Verify the viewset returns catalogs of all enterprises for admins with wildcard permission.
+        """
+        for is_role_assigned_via_jwt in (False, True):
+            with self.atomic_subtest(is_role_assigned_via_jwt=is_role_assigned_via_jwt):
+                if is_role_assigned_via_jwt:
+                    self.assign_catalog_admin_jwt_role('*')
+                else:
+                    # This will cause a feature role assignment to be created with a null enterprise UUID,
+                    # which is interpretted as having access to catalogs of ANY enterprise.
+                    self.assign_catalog_admin_feature_role(enterprise_uuids=[None])
+
+                catalog_b = EnterpriseCatalogFactory(enterprise_uuid=_test_uuid())
+                catalog_c = EnterpriseCatalogFactory(enterprise_uuid=_test_uuid())
+
+                with self.assertNumQueries(self.list_num_queries):
+                    response = self.client.get(self.list_url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data['count'], 3)
+                results = response.data['results']
+                self.assertEqual(uuid.UUID(results[0]['uuid']), self.enterprise_catalog.uuid)
+                self.assertEqual(uuid.UUID(results[1]['uuid']), catalog_b.uuid)
+                self.assertEqual(uuid.UUID(results[2]['uuid']), catalog_c.uuid)
 
     @ddt.data(
-        False,
-        True,
+        (False, 1),
+        (False, 3),
+        (False, 10),
+        (True, 1),
+        (True, 3),
+        (True, 10),
     )
-    def test_every_catalog_for_catalog_admins(self, is_role_assigned_via_jwt):
+    @ddt.unpack
+    def test_list_num_queries_independent_of_catalog_count(self, is_role_assigned_via_jwt, num_catalogs):
         """
-        Verify the viewset returns catalogs of all enterprises for admins with wildcard permission.
+        Verify the number of queries made by the list endpoint does not grow with the number of catalogs returned.
         """
+        # Title the extra catalog queries explicitly, as the factory's random words can collide across many catalogs
+        catalogs = [self.enterprise_catalog] + [
+            EnterpriseCatalogFactory(
+                enterprise_uuid=self.enterprise_uuid,
+                catalog_query=CatalogQueryFactory(title=f'Catalog query {index}'),
+            )
+            for index in range(num_catalogs - 1)
+        ]
+        for catalog in catalogs:
+            self.add_metadata_to_catalog(catalog, [ContentMetadataFactory()])
+
         if is_role_assigned_via_jwt:
-            self.assign_catalog_admin_jwt_role('*')
+            self.assign_catalog_admin_jwt_role()
         else:
-            # This will cause a feature role assignment to be created with a null enterprise UUID,
-            # which is interpretted as having access to catalogs of ANY enterprise.
-            self.assign_catalog_admin_feature_role(enterprise_uuids=[None])
-
-        catalog_b = EnterpriseCatalogFactory(enterprise_uuid=uuid.uuid4())
-        catalog_c = EnterpriseCatalogFactory(enterprise_uuid=uuid.uuid4())
+            self.assign_catalog_admin_feature_role()
 
-        url = reverse('api:v1:enterprise-catalog-list')
-        response = self.client.get(url)
+        with self.assertNumQueries(self.list_num_queries):
+            response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], 3)
-        results = response.data['results']
-        self.assertEqual(uuid.UUID(results[0]['uuid']), self.enterprise_catalog.uuid)
-        self.assertEqual(uuid.UUID(results[1]['uuid']), catalog_b.uuid)
-        self.assertEqual(uuid.UUID(results[2]['uuid']), catalog_c.uuid)
+        self.assertEqual(response.data['count'], num_catalogs)
+        for result in response.data['results']:
+            self.assertIsNotNone(result['content_last_modified'])
+
+    def test_list_content_last_modified(self):
+        """
+        Verify the list endpoint gives each catalog's `content_last_modified` as the most recent modified time of its
+        associated content, ignoring content whose association was removed, as the detail endpoint does.
+        """
+        now = localized_utcnow()
+        older_content = ContentMetadataFactory()
+        newest_content = ContentMetadataFactory()
+        removed_content = ContentMetadataFactory()
+        self.add_metadata_to_catalog(self.enterprise_catalog, [older_content, newest_content, removed_content])
+        ContentMetadata.objects.filter(pk=older_content.pk).update(modified=now - timedelta(days=2))
+        ContentMetadata.objects.filter(pk=newest_content.pk).update(modified=now - timedelta(days=1))
+        ContentMetadata.objects.filter(pk=removed_content.pk).update(modified=now)
+        # Soft deletes the association of the most recently modified content with the catalog
+        ContentMetadataToQueries.objects.filter(content_metadata=removed_content).delete()
+        self.assign_catalog_admin_feature_role()
+
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 1)
+        content_last_modified = response.data['results'][0]['content_last_modified']
+        self.assertEqual(content_last_modified, now - timedelta(days=1))
+        detail_url = reverse('api:v1:enterprise-catalog-detail', kwargs={'uuid': self.enterprise_catalog.uuid})
+        self.assertEqual(content_last_modified, self.client.get(detail_url).data['content_last_modified'])
 
     def test_list_unauthorized_catalog_learner(self):
         """
         Verify the viewset rejects list for catalog learners
         """
         self.set_up_catalog_learner()
-        url = reverse('api:v1:enterprise-catalog-list')
-        response = self.client.get(url)
+        response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
 
@@ -523,236 +605,153 @@ class EnterpriseCatalogCsvDataViewTests(APITestMixin):
     """
     Tests for the CatalogCsvDataView view.
     """
-    mock_algolia_hits = {'hits': [{
-        'aggregation_key': 'course:MITx+18.01.2x',
-        'key': 'MITx+18.01.2x',
-        'language': 'English',
-        'level_type': 'Intermediate',
-        'content_type': 'course',
-        'partners': [
-            {'name': 'Massachusetts Institute of Technology',
-             'logo_image_url': 'https://edx.org/image.png'}
-        ],
-        'programs': ['Professional Certificate'],
-        'program_titles': ['Totally Awesome Program'],
-        'short_description': 'description',
-        'subjects': ['Math'],
-        'skills': [{
-            'name': 'Probability And Statistics',
-            'description': 'description'
-        }, {
-            'name': 'Engineering Design Process',
-            'description': 'description'
-        }],
-        'title': 'Calculus 1B: Integration',
-        'marketing_url': 'edx.org/foo-bar',
-        'first_enrollable_paid_seat_price': 100,
-        'advertised_course_run': {
-            'key': 'MITx/18.01.2x/3T2015',
-            'pacing_type': 'instructor_paced',
-            'start': '2015-09-08T00:00:00Z',
-            'end': '2015-09-08T00:00:01Z',
-            'upgrade_deadline': 32503680000.0,
-            'max_effort': 10,
-            'min_effort': 1,
-            'weeks_to_complete': 1,
-        },
-        'outcome': '<p>learn</p>',
-        'prerequisites_raw': '<p>interest</p>',
-        'objectID': 'course-3543aa4e-3c64-4d9a-a343-5d5eda1dacf8-catalog-query-uuids-0'
-    },
-        {
-        'aggregation_key': 'course:MITx+19',
-        'key': 'MITx+19',
-        'language': 'English',
-        'level_type': 'Intermediate',
-        'objectID': 'course-3543aa4e-3c64-4d9a-a343-5d5eda1dacf9-catalog-query-uuids-0'
-    },
-        {
-        'aggregation_key': 'course:MITx+20',
-        'language': 'English',
-        'level_type': 'Intermediate',
-        'objectID': 'course-3543aa4e-3c64-4d9a-a343-5d5eda1dacf7-catalog-query-uuids-0'
-    }
-    ]}
-
-    expected_result_data = 'Title,Partner Name,Start,End,Verified Upgrade Deadline,Program Type,Program Name,Pacing,' \
-                           'Level,Price,Language,URL,Short Description,Subjects,Key,Short Key,Skills,Min Effort,' \
-                           'Max Effort,Length,What You’ll Learn,Pre-requisites\r\nCalculus 1B: ' \
-                           'Integration,Massachusetts Institute of Technology,2015-09-08,' \
-                           '2015-09-08,3000-01-01,Professional Certificate,Totally ' \
-                           'Awesome Program,instructor_paced,Intermediate,100,English,edx.org/foo-bar,description,' \
-                           'Math,MITx/18.01.2x/3T2015,course:MITx+18.01.2x,"Probability And Statistics, ' \
-                           'Engineering Design Process",1,10,1,learn,interest\r\n'
-
-    def setUp(self):
-        super().setUp()
-        self.set_up_staff_user()
+    algolia_client_path = 'enterprise_catalog.apps.api.v1.views.catalog_csv_data.get_initialized_algolia_client'
+    url = reverse_lazy('api:v1:catalog-csv-data')
 
-    def _get_contains_content_base_url(self):
+    @classmethod
+    def mock_algolia_hits(cls):
         """
-        Helper to construct the base url for the contains_content_items endpoint
+        Returns the Algolia search payload shared by every test in this class.
         """
-        return reverse('api:v1:catalog-csv-data')
+        return _CSV_DATA_ALGOLIA_HITS
 
-    def _get_mock_algolia_hits_with_missing_values(self):
-        mock_hits_missing_values = copy.deepcopy(self.mock_algolia_hits)
-        mock_hits_missing_values['hits'][0]['advertised_course_run'].pop('upgrade_deadline')
-        mock_hits_missing_values['hits'][0].pop('marketing_url')
-        mock_hits_missing_values['hits'][0].pop('first_enrollable_paid_seat_price')
-        mock_hits_missing_values['hits'][0]['advertised_course_run']['end'] = None
-        return mock_hits_missing_values
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The view merges any discovery course into its Algolia hit, which would leak into the shared mock payloads
+        discovery_patcher = mock.patch(
+            'enterprise_catalog.apps.api.v1.views.catalog_csv_data.DiscoveryApiClient',
+            **{'return_value.get_courses.return_value': []},
+        )
+        discovery_patcher.start()
+        cls.addClassCleanup(discovery_patcher.stop)
 
-    def test_facet_validation(self):
+    def setUp(self):
+        super().setUp()
+        self.set_up_staff_user_fast()
+
+    def _get_mock_algolia_hits_with_missing_values(self):
         """
-        Tests that the view validates Algolia facets provided by query params
+        Returns the mocked Algolia search payload with values missing from its first hit, copying only the dicts
+        that change so the rest of the payload is shared with the class constant.
         """
-        url = self._get_contains_content_base_url()
-        invalid_facets = 'invalid_facet=wrong'
-        response = self.client.get(f'{url}?{invalid_facets}')
-        assert response.status_code == 400
-        assert response.data == "Error: invalid facet(s): ['invalid_facet'] provided."
+        hits = list(self.mock_algolia_hits()['hits'])
+        first_hit = dict(hits[0])
+        first_hit.pop('marketing_url', None)
+        first_hit.pop('first_enrollable_paid_seat_price', None)
+        advertised_course_run = dict(first_hit['advertised_course_run'])
+        advertised_course_run.pop('upgrade_deadline', None)
+        advertised_course_run['end'] = None
+        first_hit['advertised_course_run'] = advertised_course_run
+        hits[0] = first_hit
+        return {'hits': hits}
 
-    @mock.patch('enterprise_catalog.apps.api.v1.views.catalog_csv_data.get_initialized_algolia_client')
-    def test_valid_facet_validation(self, mock_algolia_client):
+    def test_valid_facet_validation(self):
         """
         Tests a successful request with facets.
         """
-        mock_algolia_client.return_value.algolia_index.search.side_effect = [self.mock_algolia_hits, {'hits': []}]
-        url = self._get_contains_content_base_url()
         facets = 'language=English'
-        response = self.client.get(f'{url}?{facets}')
+        with self.mock_algolia_search(self.algolia_client_path, self.mock_algolia_hits(), _EMPTY_ALGOLIA_HITS):
+            response = self.client.get(f'{self.url}?{facets}')
         assert response.status_code == 200
 
         expected_response = {
-            'csv_data': self.expected_result_data
+            'csv_data': _expected_csv([_EXPECTED_CSV_ROW])
         }
         assert response.data == expected_response
 
-    @mock.patch('enterprise_catalog.apps.api.v1.views.catalog_csv_data.get_initialized_algolia_client')
-    def test_csv_row_construction_handles_missing_values(self, mock_algolia_client):
+    def test_csv_row_construction_handles_missing_values(self):
         """
         Tests that the view properly handles situations where data is missing from the Algolia hit.
         """
-        mock_side_effects = [self._get_mock_algolia_hits_with_missing_values(), {'hits': []}]
-        mock_algolia_client.return_value.algolia_index.search.side_effect = mock_side_effects
-        url = self._get_contains_content_base_url()
         facets = 'language=English'
-        response = self.client.get(f'{url}?{facets}')
+        mock_algolia_hits = self._get_mock_algolia_hits_with_missing_values()
+        with self.mock_algolia_search(self.algolia_client_path, mock_algolia_hits, _EMPTY_ALGOLIA_HITS):
+            response = self.client.get(f'{self.url}?{facets}')
         assert response.status_code == 200
-        excpected_csv_data = 'Title,Partner Name,Start,End,Verified Upgrade Deadline,Program Type,Program Name,' \
-                             'Pacing,Level,Price,Language,URL,Short Description,Subjects,Key,Short Key,Skills,' \
-                             'Min Effort,Max Effort,Length,What You’ll Learn,Pre-requisites\r\n' \
-                             'Calculus 1B: Integration,Massachusetts Institute of Technology,2015-09-08,' \
-                             ',,Professional Certificate,Totally Awesome ' \
-                             'Program,instructor_paced,Intermediate,,English,,description,' \
-                             'Math,MITx/18.01.2x/3T2015,course:MITx+18.01.2x,"Probability And Statistics, ' \
-                             'Engineering Design Process",1,10,1,learn,interest\r\n'
         expected_response = {
-            'csv_data': excpected_csv_data
+            'csv_data': _expected_csv([{
+                **_EXPECTED_CSV_ROW,
+                'End': '',
+                'Verified Upgrade Deadline': '',
+                'Price': '',
+                'URL': '',
+            }])
         }
         assert response.data == expected_response
 
 
+class EnterpriseCatalogExportValidationTests(APISimpleTestCase):
+    """
+    Tests for the query param validation of the catalog export views, which rejects requests before any data is read.
+    """
+    default_catalog_results_url = reverse_lazy('api:v1:default-course-set')
+    csv_data_url = reverse_lazy('api:v1:catalog-csv-data')
+
+    def test_default_catalog_results_facet_validation(self):
+        """
+        Tests that the DefaultCatalogResultsView validates Algolia facets provided by query params
+        """
+        invalid_facets = 'invalid_facet=wrong&enterprise_catalog_query_titles=ayylmao'
+        response = self.client.get(f'{self.default_catalog_results_url}?{invalid_facets}')
+        assert response.status_code == 400
+        assert response.json() == {'Error': "invalid facet(s): ['invalid_facet'] provided."}
+
+    def test_default_catalog_results_required_param_validation(self):
+        """
+        Tests that the DefaultCatalogResultsView requires a provided catalog
+        """
+        invalid_facets = 'bad=ayylmao'
+        response = self.client.get(f'{self.default_catalog_results_url}?{invalid_facets}')
+        assert response.status_code == 400
+        assert response.json() == [
+            'You must provide at least one of the following query parameters: enterprise_catalog_query_titles.'
+        ]
+
+    def test_csv_data_facet_validation(self):
+        """
+        Tests that the CatalogCsvDataView validates Algolia facets provided by query params
+        """
+        invalid_facets = 'invalid_facet=wrong'
+        response = self.client.get(f'{self.csv_data_url}?{invalid_facets}')
+        assert response.status_code == 400
+        assert response.data == "Error: invalid facet(s): ['invalid_facet'] provided."
+
+
 class EnterpriseCatalogWorkbookViewTests(APITestMixin):
     """
     Tests for the CatalogWorkbookView view.
     """
-    mock_algolia_hits = {'hits': [{
-        'aggregation_key': 'course:MITx+18.01.2x',
-        'key': 'MITx+18.01.2x',
-        'language': 'English',
-        'level_type': 'Intermediate',
-        'content_type': 'course',
-        'partners': [
-            {'name': 'Massachusetts Institute of Technology',
-             'logo_image_url': 'https://edx.org/image.png'}
-        ],
-        'programs': ['Professional Certificate'],
-        'program_titles': ['Totally Awesome Program'],
-        'short_description': 'description',
-        'subjects': ['Math'],
-        'skills': [{
-            'name': 'Probability And Statistics',
-            'description': 'description'
-        }, {
-            'name': 'Engineering Design Process',
-            'description': 'description'
-        }],
-        'title': 'Calculus 1B: Integration',
-        'marketing_url': 'edx.org/foo-bar',
-        'first_enrollable_paid_seat_price': 100,
-        'advertised_course_run': {
-            'key': 'MITx/18.01.2x/3T2015',
-            'pacing_type': 'instructor_paced',
-            'start': '2015-09-08T00:00:00Z',
-            'end': '2015-09-08T00:00:01Z',
-            'upgrade_deadline': 32503680000.0,
-            'max_effort': 10,
-            'min_effort': 1,
-            'weeks_to_complete': 1,
-        },
-        'course_runs': [
-            {
-                'key': 'MITx/18.01.2x/3T2015',
-                'pacing_type': 'instructor_paced',
-                'start': '2015-09-08T00:00:00Z',
-                'end': '2015-09-08T00:00:01Z',
-                'upgrade_deadline': 32503680000.0,
-                'max_effort': 10,
-                'min_effort': 1,
-                'weeks_to_complete': 1,
-            }
-        ],
-        'outcome': '<p>learn</p>',
-        'prerequisites_raw': '<p>interest</p>',
-        'objectID': 'course-3543aa4e-3c64-4d9a-a343-5d5eda1dacf8-catalog-query-uuids-0'
-    },
-        {
-        'aggregation_key': 'course:MITx+19',
-        'key': 'MITx+19',
-        'language': 'English',
-        'level_type': 'Intermediate',
-        'objectID': 'course-3543aa4e-3c64-4d9a-a343-5d5eda1dacf9-catalog-query-uuids-0'
-    },
-        {
-        'aggregation_key': 'course:MITx+20',
-        'language': 'English',
-        'level_type': 'Intermediate',
-        'objectID': 'course-3543aa4e-3c64-4d9a-a343-5d5eda1dacf7-catalog-query-uuids-0'
-    }
-    ]}
-
-    def setUp(self):
-        super().setUp()
-        self.set_up_staff_user()
+    algolia_client_path = 'enterprise_catalog.apps.api.v1.views.catalog_workbook.get_initialized_algolia_client'
+    url = reverse_lazy('api:v1:catalog-workbook')
 
-    def _get_contains_content_base_url(self):
+    @classmethod
+    def mock_algolia_hits(cls):
         """
-        Helper to construct the base url for the contains_content_items endpoint
+        Returns the Algolia search payload shared by every test in this class.
         """
-        return reverse('api:v1:catalog-workbook')
+        return _WORKBOOK_ALGOLIA_HITS
+
+    def setUp(self):
+        super().setUp()
+        self.set_up_staff_user_fast()
 
-    @mock.patch('enterprise_catalog.apps.api.v1.views.catalog_workbook.get_initialized_algolia_client')
-    def test_empty_results_error(self, mock_algolia_client):
+    def test_empty_results_error(self):
         """
         Tests when algolia returns no hits.
         """
-        mock_algolia_client.return_value.algolia_index.search.side_effect = [{'hits': []}]
-        url = self._get_contains_content_base_url()
         facets = 'language=English'
-        response = self.client.get(f'{url}?{facets}')
+        with self.mock_algolia_search(self.algolia_client_path, _EMPTY_ALGOLIA_HITS):
+            response = self.client.get(f'{self.url}?{facets}')
         assert response.status_code == 400
 
-    @mock.patch('enterprise_catalog.apps.api.v1.views.catalog_workbook.get_initialized_algolia_client')
-    def test_success(self, mock_algolia_client):
+    def test_success(self):
         """
         Tests basic, successful output.
         """
-        mock_algolia_client.return_value.algolia_index.search.side_effect = [self.mock_algolia_hits, {'hits': []}]
-        url = self._get_contains_content_base_url()
         facets = 'language=English'
-        response = self.client.get(f'{url}?{facets}')
+        with self.mock_algolia_search(self.algolia_client_path, self.mock_algolia_hits(), _EMPTY_ALGOLIA_HITS):
+            response = self.client.get(f'{self.url}?{facets}')
         assert response.status_code == 200
 
 
@@ -760,18 +759,24 @@ class EnterpriseCatalogContainsContentItemsTests(APITestMixin):
     """
     Tests on the contains_content_items on enterprise catalogs endpoint
     """
+    contains_url_template = _url_template('api:v1:enterprise-catalog-contains-content-items')
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Set up catalog.has_learner_access permissions
+        cls.create_catalog_learner()
+        cls.enterprise_catalog = EnterpriseCatalogFactory(enterprise_uuid=cls.enterprise_uuid)
 
     def setUp(self):
         super().setUp()
-        # Set up catalog.has_learner_access permissions
-        self.set_up_catalog_learner()
-        self.enterprise_catalog = EnterpriseCatalogFactory(enterprise_uuid=self.enterprise_uuid)
+        self.log_in_catalog_learner()
 
     def _get_contains_content_base_url(self, enterprise_catalog):
         """
         Helper to construct the base url for the contains_content_items endpoint
         """
-        return reverse('api:v1:enterprise-catalog-contains-content-items', kwargs={'uuid': enterprise_catalog.uuid})
+        return _url_for(self.contains_url_template, enterprise_catalog.uuid)
 
     def test_contains_content_items_no_params(self):
         """
@@ -818,13 +823,17 @@ class EnterpriseCatalogContainsContentItemsTests(APITestMixin):
         self.add_metadata_to_catalog(self.enterprise_catalog, [associated_metadata])
 
         url = self._get_contains_content_base_url(self.enterprise_catalog) + '?course_run_ids=' + content_key
-        self.assert_correct_contains_response(url, True)
+        # The requesting user, the catalog (fetched once for both the permission check and the contains check), its
+        # catalog query, the parents of the requested content, and the contains check itself
+        with self.assertNumQueries(5):
+            self.assert_correct_contains_response(url, True)
 
     def test_contains_content_items_parent_keys_in_catalog(self):
         """
         Verify the contains_content_items endpoint returns True if the parent's key is in the catalog
         """
-        parent_metadata = ContentMetadataFactory(content_key='parent-key')
+        # Only the parent's key is searched for, so the parent itself never needs saving
+        parent_metadata = ContentMetadataFactory.build(content_key='parent-key')
         associated_metadata = ContentMetadataFactory(
             content_key='child-key+101x',
             parent_content_key=parent_metadata.content_key
@@ -871,50 +880,73 @@ class EnterpriseCatalogGetContentMetadataTests(APITestMixin):
     """
     Tests on the get_content_metadata endpoint
     """
+    get_content_metadata_url_template = _url_template('api:v1:get-content-metadata')
+    # Small enough that forcing a second page only takes a handful of rows
+    page_size = 3
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.patch_enterprise_api_client()
+        page_size_patcher = mock.patch.object(PageNumberWithSizePagination, 'page_size', cls.page_size)
+        page_size_patcher.start()
+        cls.addClassCleanup(page_size_patcher.stop)
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Set up catalog.has_learner_access permissions
+        cls.create_catalog_learner()
+        cls.enterprise_catalog = EnterpriseCatalogFactory(enterprise_uuid=cls.enterprise_uuid)
+        # The utm_source of every expected url, slugified once rather than per url
+        cls.utm_source = slugify(cls.enterprise_catalog.enterprise_name)
 
     def setUp(self):
         super().setUp()
-        # Set up catalog.has_learner_access permissions
-        self.set_up_catalog_learner()
-        self.enterprise_catalog = EnterpriseCatalogFactory(enterprise_uuid=self.enterprise_uuid)
-        # Delete any existing ContentMetadata records.
-        ContentMetadata.objects.all().delete()
+        self.log_in_catalog_learner()
+        self.mock_api_client.reset_mock(return_value=True)
+
+    def _create_metadata_batch(self, size):
+        """
+        Helper to insert the given number of ContentMetadata with a single query, returning them in creation order
+        """
+        metadata = ContentMetadataFactory.build_batch(size)
+        ContentMetadata.objects.bulk_create(metadata)
+        # Neither SQLite nor MySQL report the primary keys of bulk inserted rows, so read them back
+        content_keys = [item.content_key for item in metadata]
+        return list(ContentMetadata.objects.filter(content_key__in=content_keys).order_by('id'))
 
     def _get_content_metadata_url(self, enterprise_catalog):
         """
         Helper to get the get_content_metadata endpoint url for a given catalog
         """
-        return reverse('api:v1:get-content-metadata', kwargs={'uuid': enterprise_catalog.uuid})
+        return _url_for(self.get_content_metadata_url_template, enterprise_catalog.uuid)
 
     def _get_expected_json_metadata(self, content_metadata, learner_portal_enabled):
         """
         Helper to get the expected json_metadata from the passed in content_metadata instance
         """
         content_type = content_metadata.content_type
-        json_metadata = content_metadata.json_metadata.copy()
-
-        json_metadata['content_last_modified'] = content_metadata.modified.isoformat()[:-6] + 'Z'
-        if learner_portal_enabled and content_type in (COURSE, COURSE_RUN):
-            enrollment_url = '{}/{}/course/{}?{}utm_medium=enterprise&utm_source={}'
-        else:
-            enrollment_url = '{}/enterprise/{}/{}/{}/enroll/?catalog={}&utm_medium=enterprise&utm_source={}'
-        marketing_url = '{}?utm_medium=enterprise&utm_source={}'
-        xapi_activity_id = '{}/xapi/activities/{}/{}'
+        json_metadata = {
+            **content_metadata.json_metadata,
+            'content_last_modified': content_metadata.modified.isoformat()[:-6] + 'Z',
+        }
+        utm_params = f'utm_medium=enterprise&utm_source={self.utm_source}'
+        lms_enrollment_url_prefix = f'{settings.LMS_BASE_URL}/enterprise/{self.enterprise_catalog.enterprise_uuid}'
+        lms_enrollment_url_params = f'enroll/?catalog={self.enterprise_catalog.uuid}&{utm_params}'
+        learner_portal_course_url_prefix = (
+            f'{settings.ENTERPRISE_LEARNER_PORTAL_BASE_URL}/{self.enterprise_slug}/course'
+        )
 
         if json_metadata.get('uuid'):
             json_metadata['uuid'] = str(json_metadata.get('uuid'))
 
         if json_metadata.get('marketing_url'):
-            json_metadata['marketing_url'] = marketing_url.format(
-                json_metadata['marketing_url'],
-                slugify(self.enterprise_catalog.enterprise_name),
-            )
+            json_metadata['marketing_url'] = f"{json_metadata['marketing_url']}?{utm_params}"
 
         if content_type in (COURSE, COURSE_RUN):
-            json_metadata['xapi_activity_id'] = xapi_activity_id.format(
-                settings.LMS_BASE_URL,
-                content_type,
-                json_metadata.get('key'),
+            json_metadata['xapi_activity_id'] = (
+                f"{settings.LMS_BASE_URL}/xapi/activities/{content_type}/{json_metadata.get('key')}"
             )
 
         # course
@@ -922,43 +954,21 @@ class EnterpriseCatalogGetContentMetadataTests(APITestMixin):
             course_key = json_metadata.get('key')
             course_runs = json_metadata.get('course_runs') or []
             if learner_portal_enabled:
-                course_enrollment_url = enrollment_url.format(
-                    settings.ENTERPRISE_LEARNER_PORTAL_BASE_URL,
-                    self.enterprise_slug,
-                    course_key,
-                    '',
-                    slugify(self.enterprise_catalog.enterprise_name),
-                )
-                json_metadata['enrollment_url'] = course_enrollment_url
+                learner_portal_course_url = f'{learner_portal_course_url_prefix}/{course_key}'
+                json_metadata['enrollment_url'] = f'{learner_portal_course_url}?{utm_params}'
                 for course_run in course_runs:
                     course_run_key = quote_plus(course_run.get('key'))
-                    course_run_key_param = f'course_run_key={course_run_key}&'
-                    course_run_enrollment_url = enrollment_url.format(
-                        settings.ENTERPRISE_LEARNER_PORTAL_BASE_URL,
-                        self.enterprise_slug,
-                        course_key,
-                        course_run_key_param,
-                        slugify(self.enterprise_catalog.enterprise_name),
+                    course_run_enrollment_url = (
+                        f'{learner_portal_course_url}?course_run_key={course_run_key}&{utm_params}'
                     )
                     course_run.update({'enrollment_url': course_run_enrollment_url})
             else:
-                course_enrollment_url = enrollment_url.format(
-                    settings.LMS_BASE_URL,
-                    self.enterprise_catalog.enterprise_uuid,
-                    COURSE,
-                    course_key,
-                    self.enterprise_catalog.uuid,
-                    slugify(self.enterprise_catalog.enterprise_name),
+                json_metadata['enrollment_url'] = (
+                    f'{lms_enrollment_url_prefix}/{COURSE}/{course_key}/{lms_enrollment_url_params}'
                 )
-                json_metadata['enrollment_url'] = course_enrollment_url
                 for course_run in course_runs:
-                    course_run_enrollment_url = enrollment_url.format(
-                        settings.LMS_BASE_URL,
-                        self.enterprise_catalog.enterprise_uuid,
-                        COURSE,
-                        course_run.get('key'),
-                        self.enterprise_catalog.uuid,
-                        slugify(self.enterprise_catalog.enterprise_name),
+                    course_run_enrollment_url = (
+                        f"{lms_enrollment_url_prefix}/{COURSE}/{course_run.get('key')}/{lms_enrollment_url_params}"
                     )
                     course_run.update({'enrollment_url': course_run_enrollment_url})
 
@@ -970,37 +980,19 @@ class EnterpriseCatalogGetContentMetadataTests(APITestMixin):
             if learner_portal_enabled:
                 course_key = get_parent_content_key(json_metadata)
                 course_run_key = quote_plus(json_metadata.get('key'))
-                course_run_key_param = f'course_run_key={course_run_key}&'
-                course_run_enrollment_url = enrollment_url.format(
-                    settings.ENTERPRISE_LEARNER_PORTAL_BASE_URL,
-                    self.enterprise_slug,
-                    course_key,
-                    course_run_key_param,
-                    slugify(self.enterprise_catalog.enterprise_name),
+                json_metadata['enrollment_url'] = (
+                    f'{learner_portal_course_url_prefix}/{course_key}?course_run_key={course_run_key}&{utm_params}'
                 )
-                json_metadata['enrollment_url'] = course_run_enrollment_url
             else:
-                course_run_enrollment_url = enrollment_url.format(
-                    settings.LMS_BASE_URL,
-                    self.enterprise_catalog.enterprise_uuid,
-                    COURSE,
-                    json_metadata.get('key'),
-                    self.enterprise_catalog.uuid,
-                    slugify(self.enterprise_catalog.enterprise_name),
+                json_metadata['enrollment_url'] = (
+                    f"{lms_enrollment_url_prefix}/{COURSE}/{json_metadata.get('key')}/{lms_enrollment_url_params}"
                 )
-                json_metadata['enrollment_url'] = course_run_enrollment_url
 
         # program
         if content_type == PROGRAM:
-            program_enrollment_url = enrollment_url.format(
-                settings.LMS_BASE_URL,
-                self.enterprise_catalog.enterprise_uuid,
-                PROGRAM,
-                json_metadata.get('key'),
-                self.enterprise_catalog.uuid,
-                slugify(self.enterprise_catalog.enterprise_name),
+            json_metadata['enrollment_url'] = (
+                f"{lms_enrollment_url_prefix}/{PROGRAM}/{json_metadata.get('key')}/{lms_enrollment_url_params}"
             )
-            json_metadata['enrollment_url'] = program_enrollment_url
 
         return json_metadata
 
@@ -1046,52 +1038,44 @@ class EnterpriseCatalogGetContentMetadataTests(APITestMixin):
         url = self._get_content_metadata_url(no_catalog_query_catalog)
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.json()['results'], [])
+        self.assertEqual(response.data['results'], [])
 
-    @mock.patch('enterprise_catalog.apps.api_client.enterprise_cache.EnterpriseApiClient')
     @ddt.data(
         False,
         True
     )
-    def test_get_content_metadata_content_filters(self, learner_portal_enabled, mock_api_client):
+    def test_get_content_metadata_content_filters(self, learner_portal_enabled):
         """
         Test that the get_content_metadata view GET view will filter provided content_keys (up to a limit)
         """
-        mock_api_client.return_value.get_enterprise_customer.return_value = {
+        self.mock_api_client.return_value.get_enterprise_customer.return_value = {
             'slug': self.enterprise_slug,
             'enable_learner_portal': learner_portal_enabled,
-            'modified': str(datetime.now().replace(tzinfo=pytz.UTC)),
+            'modified': _ENTERPRISE_CUSTOMER_MODIFIED,
         }
         ContentMetadataFactory.reset_sequence(10)
-        metadata = ContentMetadataFactory.create_batch(api_settings.PAGE_SIZE)
-        filtered_content_keys = []
+        metadata = self._create_metadata_batch(self.page_size)
+        filtered_content_keys = [item.content_key for item in metadata[:int(self.page_size / 2)]]
         url = self._get_content_metadata_url(self.enterprise_catalog)
-        for filter_content_key_index in range(int(api_settings.PAGE_SIZE / 2)):
-            filtered_content_keys.append(metadata[filter_content_key_index].content_key)
-            url += f"&content_keys={metadata[filter_content_key_index].content_key}"
 
         self.add_metadata_to_catalog(self.enterprise_catalog, metadata)
-        response = self.client.get(
-            url,
-            {'content_keys': filtered_content_keys}
-        )
-        assert response.data.get('count') == int(api_settings.PAGE_SIZE / 2)
+        response = self.client.get(url, {'content_keys': filtered_content_keys})
+        assert response.data.get('count') == int(self.page_size / 2)
         for result in response.data.get('results'):
             assert result.get('key') in filtered_content_keys
 
-    @mock.patch('enterprise_catalog.apps.api_client.enterprise_cache.EnterpriseApiClient')
     @ddt.data(
         False,
         True
     )
-    def test_get_content_metadata(self, learner_portal_enabled, mock_api_client):
+    def test_get_content_metadata(self, learner_portal_enabled):
         """
         Verify the get_content_metadata endpoint returns all the metadata associated with a particular catalog
         """
-        mock_api_client.return_value.get_enterprise_customer.return_value = {
+        self.mock_api_client.return_value.get_enterprise_customer.return_value = {
             'slug': self.enterprise_slug,
             'enable_learner_portal': learner_portal_enabled,
-            'modified': str(datetime.now().replace(tzinfo=pytz.UTC)),
+            'modified': _ENTERPRISE_CUSTOMER_MODIFIED,
         }
         # The ContentMetadataFactory creates content with keys that are generated using a string builder with a
         # factory sequence (index is appended onto each content key). The results are sorted by key which creates
@@ -1100,13 +1084,13 @@ class EnterpriseCatalogGetContentMetadataTests(APITestMixin):
         # 10 we avoid that sorting issue.
         ContentMetadataFactory.reset_sequence(10)
         # Create enough metadata to force pagination
-        metadata = ContentMetadataFactory.create_batch(api_settings.PAGE_SIZE + 1)
+        metadata = self._create_metadata_batch(self.page_size + 1)
         self.add_metadata_to_catalog(self.enterprise_catalog, metadata)
         url = self._get_content_metadata_url(self.enterprise_catalog)
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         response_data = response.json()
-        self.assertEqual((response_data['count']), api_settings.PAGE_SIZE + 1)
+        self.assertEqual((response_data['count']), self.page_size + 1)
         self.assertEqual(uuid.UUID(response_data['uuid']), self.enterprise_catalog.uuid)
         self.assertEqual(response_data['title'], self.enterprise_catalog.title)
         self.assertEqual(uuid.UUID(response_data['enterprise_customer']), self.enterprise_catalog.enterprise_uuid)
@@ -1122,38 +1106,34 @@ class EnterpriseCatalogGetContentMetadataTests(APITestMixin):
             for item in metadata
         ], key=itemgetter('key'))
         actual_metadata = sorted(
-            response_data['results'] + second_response_data['results'],
+            itertools.chain(response_data['results'], second_response_data['results']),
             key=itemgetter('key')
         )
 
-        self.assertEqual(
-            json.dumps(actual_metadata, sort_keys=True),
-            json.dumps(expected_metadata, sort_keys=True),
-        )
+        self.assertEqual(actual_metadata, expected_metadata)
 
-    @mock.patch('enterprise_catalog.apps.api_client.enterprise_cache.EnterpriseApiClient')
     @ddt.data(
         False,
         True
     )
-    def test_get_content_metadata_traverse_pagination(self, learner_portal_enabled, mock_api_client):
+    def test_get_content_metadata_traverse_pagination(self, learner_portal_enabled):
         """
         Verify the get_content_metadata endpoint returns all metadata on one page if the traverse pagination query
         parameter is added.
         """
-        mock_api_client.return_value.get_enterprise_customer.return_value = {
+        self.mock_api_client.return_value.get_enterprise_customer.return_value = {
             'slug': self.enterprise_slug,
             'enable_learner_portal': learner_portal_enabled,
-            'modified': str(datetime.now().replace(tzinfo=pytz.UTC)),
+            'modified': _ENTERPRISE_CUSTOMER_MODIFIED,
         }
         # Create enough metadata to force pagination (if the query parameter wasn't sent)
-        metadata = ContentMetadataFactory.create_batch(api_settings.PAGE_SIZE + 1)
+        metadata = self._create_metadata_batch(self.page_size + 1)
         self.add_metadata_to_catalog(self.enterprise_catalog, metadata)
         url = self._get_content_metadata_url(self.enterprise_catalog) + '?traverse_pagination=1'
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         response_data = response.json()
-        self.assertEqual((response_data['count']), api_settings.PAGE_SIZE + 1)
+        self.assertEqual((response_data['count']), self.page_size + 1)
         self.assertEqual(uuid.UUID(response_data['uuid']), self.enterprise_catalog.uuid)
         self.assertEqual(response_data['title'], self.enterprise_catalog.title)
         self.assertEqual(uuid.UUID(response_data['enterprise_customer']), self.enterprise_catalog.enterprise_uuid)
@@ -1168,6 +1148,7 @@ class EnterpriseCatalogRefreshDataFromDiscoveryTests(APITestMixin):
     """
     Tests for the update catalog metadata view
     """
+    refresh_url_template = _url_template('api:v1:update-enterprise-catalog')
 
     def setUp(self):
         super().setUp()
@@ -1206,7 +1187,7 @@ class EnterpriseCatalogRefreshDataFromDiscoveryTests(APITestMixin):
         # Reset the call count since it was called in the above mock
         mock_chain.reset_mock()
 
-        url = reverse('api:v1:update-enterprise-catalog', kwargs={'uuid': self.enterprise_catalog.uuid})
+        url = _url_for(self.refresh_url_template, self.enterprise_catalog.uuid)
         response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
@@ -1222,7 +1203,7 @@ class EnterpriseCatalogRefreshDataFromDiscoveryTests(APITestMixin):
         """
         Verify the refresh_metadata endpoint does not update the catalog metadata with a get request
         """
-        url = reverse('api:v1:update-enterprise-catalog', kwargs={'uuid': self.enterprise_catalog.uuid})
+        url = _url_for(self.refresh_url_template, self.enterprise_catalog.uuid)
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
 
@@ -1230,8 +1211,17 @@ class EnterpriseCatalogRefreshDataFromDiscoveryTests(APITestMixin):
         """
         Verify the refresh_metadata endpoint returns an HTTP_400_BAD_REQUEST status when passed an invalid ID
         """
-        random_uuid = uuid.uuid4()
-        url = reverse('api:v1:update-enterprise-catalog', kwargs={'uuid': random_uuid})
+        random_uuid = _test_uuid()
+        url = _url_for(self.refresh_url_template, random_uuid)
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_refresh_catalog_on_malformed_uuid_returns_404_not_found(self):
+        """
+        Verify the refresh_metadata endpoint returns an HTTP_404_NOT_FOUND status when passed something other than a
+        uuid
+        """
+        url = self.refresh_url_template.replace(_URL_PLACEHOLDER_UUID, 'not-a-uuid')
         response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
@@ -1240,44 +1230,43 @@ class EnterpriseCustomerViewSetTests(APITestMixin):
     """
     Tests for the EnterpriseCustomerViewSet
     """
+    contains_url_template = _url_template('api:v1:enterprise-customer-contains-content-items', kwarg='enterprise_uuid')
+    generate_diff_url_template = _url_template('api:v1:generate-catalog-diff')
 
-    def setUp(self):
-        super().setUp()
-        # clean up any stale test objects
-        CatalogQuery.objects.all().delete()
-        ContentMetadata.objects.all().delete()
-        EnterpriseCatalog.objects.all().delete()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.patch_enterprise_api_client()
 
-        self.enterprise_catalog = EnterpriseCatalogFactory(enterprise_uuid=self.enterprise_uuid)
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.enterprise_catalog = EnterpriseCatalogFactory(enterprise_uuid=cls.enterprise_uuid)
 
         # Set up catalog.has_learner_access permissions
-        self.set_up_catalog_learner()
+        cls.create_catalog_learner()
 
-    def tearDown(self):
-        super().tearDown()
-        # clean up any stale test objects
-        ContentMetadataToQueries.all_objects.all().hard_delete()
-        CatalogQuery.objects.all().delete()
-        ContentMetadata.objects.all().delete()
-        EnterpriseCatalog.objects.all().delete()
+    def setUp(self):
+        super().setUp()
+        self.log_in_catalog_learner()
+        self.mock_api_client.reset_mock(return_value=True)
+        self.mock_api_client.return_value.get_enterprise_customer.return_value = {
+            'slug': self.enterprise_slug,
+            'enable_learner_portal': True,
+            'modified': _ENTERPRISE_CUSTOMER_MODIFIED,
+        }
 
     def _get_contains_content_base_url(self, enterprise_uuid=None):
         """
         Helper to construct the base url for the contains_content_items endpoint
         """
-        return reverse(
-            'api:v1:enterprise-customer-contains-content-items',
-            kwargs={'enterprise_uuid': enterprise_uuid or self.enterprise_uuid},
-        )
+        return _url_for(self.contains_url_template, enterprise_uuid or self.enterprise_uuid)
 
     def _get_generate_diff_base_url(self, enterprise_catalog_uuid=None):
         """
         Helper to construct the base url for the catalog `generate_diff` endpoint
         """
-        return reverse(
-            'api:v1:generate-catalog-diff',
-            kwargs={'uuid': enterprise_catalog_uuid or self.enterprise_catalog.uuid},
-        )
+        return _url_for(self.generate_diff_url_template, enterprise_catalog_uuid or self.enterprise_catalog.uuid)
 
     def test_generate_diff_unauthorized_non_catalog_learner(self):
         """
@@ -1295,25 +1284,22 @@ class EnterpriseCustomerViewSetTests(APITestMixin):
         """
         content = ContentMetadataFactory()
         self.add_metadata_to_catalog(self.enterprise_catalog, [content])
-        url = self._get_generate_diff_base_url() + '?content_keys=key'
-
-        for key in range(150):
-            url += f"&content_keys=key{key}"
+        url = self._get_generate_diff_base_url()
+        content_keys = ['key'] + [f'key{key}' for key in range(150)]
 
-        response = self.client.get(url)
+        response = self.client.get(url, {'content_keys': content_keys})
         assert response.status_code == 400
         assert response.data == 'catalog_diff GET requests supports up to 100. If more content keys required, please ' \
                                 'use a POST body.'
 
-    @mock.patch('enterprise_catalog.apps.api_client.enterprise_cache.EnterpriseApiClient')
-    def test_generate_diff_matched_modified_uses_content(self, mock_api_client):
+    def test_generate_diff_matched_modified_uses_content(self):
         """
         Test that the generate_diff endpoint, when matching content keys, takes the content modified times into
         consideration when generating the matched key's `date_updated`.
         """
         now = self.enterprise_catalog.modified
         customer_modified = str(now - timedelta(hours=1))
-        mock_api_client.return_value.get_enterprise_customer.return_value = {
+        self.mock_api_client.return_value.get_enterprise_customer.return_value = {
             'slug': self.enterprise_slug,
             'enable_learner_portal': True,
             'modified': customer_modified,
@@ -1325,13 +1311,12 @@ class EnterpriseCustomerViewSetTests(APITestMixin):
         url = self._get_generate_diff_base_url()
         response = self.client.post(
             url,
-            data=json.dumps({"content_keys": [content.content_key]}),
-            content_type='application/json',
+            data={"content_keys": [content.content_key]},
+            format='json',
         )
         assert response.data.get('items_found')[0].get('date_updated') == content_modified
 
-    @mock.patch('enterprise_catalog.apps.api_client.enterprise_cache.EnterpriseApiClient')
-    def test_generate_diff_matched_modified_uses_customer(self, mock_api_client):
+    def test_generate_diff_matched_modified_uses_customer(self):
         """
         Test that the generate_diff endpoint, when matching content keys, takes the customer's modified times into
         consideration when generating the matched key's `date_updated`.
@@ -1339,7 +1324,7 @@ class EnterpriseCustomerViewSetTests(APITestMixin):
         now = self.enterprise_catalog.modified
         customer_modified = now + timedelta(hours=1)
         customer_modified_str = str(customer_modified)
-        mock_api_client.return_value.get_enterprise_customer.return_value = {
+        self.mock_api_client.return_value.get_enterprise_customer.return_value = {
             'slug': self.enterprise_slug,
             'enable_learner_portal': True,
             'modified': customer_modified_str,
@@ -1350,19 +1335,18 @@ class EnterpriseCustomerViewSetTests(APITestMixin):
         url = self._get_generate_diff_base_url()
         response = self.client.post(
             url,
-            data=json.dumps({"content_keys": [content.content_key]}),
-            content_type='application/json',
+            data={"content_keys": [content.content_key]},
+            format='json',
         )
         assert response.data.get('items_found')[0].get('date_updated') == customer_modified
 
-    @mock.patch('enterprise_catalog.apps.api_client.enterprise_cache.EnterpriseApiClient')
-    def test_generate_diff_matched_modified_uses_catalog(self, mock_api_client):
+    def test_generate_diff_matched_modified_uses_catalog(self):
         """
         Test that the generate_diff endpoint, when matching content keys, takes the catalog modified times into
         consideration when generating the matched key's `date_updated`.
         """
         now = self.enterprise_catalog.modified
-        mock_api_client.return_value.get_enterprise_customer.return_value = {
+        self.mock_api_client.return_value.get_enterprise_customer.return_value = {
             'slug': self.enterprise_slug,
             'enable_learner_portal': True,
             'modified': str(now - timedelta(hours=1)),
@@ -1374,21 +1358,15 @@ class EnterpriseCustomerViewSetTests(APITestMixin):
 
         response = self.client.post(
             url,
-            data=json.dumps({"content_keys": [content.content_key]}),
-            content_type='application/json',
+            data={"content_keys": [content.content_key]},
+            format='json',
         )
         assert response.data.get('items_found')[0].get('date_updated') == now
 
-    @mock.patch('enterprise_catalog.apps.api_client.enterprise_cache.EnterpriseApiClient')
-    def test_generate_diff_get_parses_all_buckets(self, mock_api_client):
+    def test_generate_diff_get_parses_all_buckets(self):
         """
         Test that GET requests to the generate_diff endpoint behave the same as POST requests.
         """
-        mock_api_client.return_value.get_enterprise_customer.return_value = {
-            'slug': self.enterprise_slug,
-            'enable_learner_portal': True,
-            'modified': str(datetime.now().replace(tzinfo=pytz.UTC)),
-        }
         content = ContentMetadataFactory()
         content2 = ContentMetadataFactory()
         content3 = ContentMetadataFactory()
@@ -1398,35 +1376,30 @@ class EnterpriseCustomerViewSetTests(APITestMixin):
         url = self._get_generate_diff_base_url()
         response = self.client.post(
             url,
-            data=json.dumps({"content_keys": [content.content_key, content2.content_key, "bad+key", "bad+key2"]}),
-            content_type='application/json',
+            data={"content_keys": [content.content_key, content2.content_key, "bad+key", "bad+key2"]},
+            format='json',
         )
         assert response.status_code == 200
         response_data = response.data
 
-        for item in response_data.get('items_not_found'):
-            assert item in [{'content_key': 'bad+key'}, {'content_key': 'bad+key2'}]
-
-        for item in response_data.get('items_not_included'):
-            assert item in [{'content_key': content3.content_key}, {'content_key': content4.content_key}]
-
-        for item in response_data.get('items_found'):
-            assert item in [
-                {'content_key': content.content_key, 'date_updated': content.modified},
-                {'content_key': content2.content_key, 'date_updated': content2.modified}
-            ]
+        self.assertCountEqual(
+            response_data.get('items_not_found'),
+            [{'content_key': 'bad+key'}, {'content_key': 'bad+key2'}],
+        )
+        self.assertCountEqual(
+            response_data.get('items_not_included'),
+            [{'content_key': content3.content_key}, {'content_key': content4.content_key}],
+        )
+        self.assertCountEqual(response_data.get('items_found'), [
+            {'content_key': content.content_key, 'date_updated': content.modified},
+            {'content_key': content2.content_key, 'date_updated': content2.modified},
+        ])
 
-    @mock.patch('enterprise_catalog.apps.api_client.enterprise_cache.EnterpriseApiClient')
-    def test_generate_diff_returns_whole_catalog_w_empty_key_list(self, mock_api_client):
+    def test_generate_diff_returns_whole_catalog_w_empty_key_list(self):
         """
         Test that the generate_diff endpoint will return all content keys under the catalog not provided under the
         `items_not_included` bucket
         """
-        mock_api_client.return_value.get_enterprise_customer.return_value = {
-            'slug': self.enterprise_slug,
-            'enable_learner_portal': True,
-            'modified': str(datetime.now().replace(tzinfo=pytz.UTC)),
-        }
         content = ContentMetadataFactory()
         self.add_metadata_to_catalog(self.enterprise_catalog, [content])
         url = self._get_generate_diff_base_url()
@@ -1435,17 +1408,11 @@ class EnterpriseCustomerViewSetTests(APITestMixin):
         assert not response.data.get('items_not_found')
         assert not response.data.get('items_found')
 
-    @mock.patch('enterprise_catalog.apps.api_client.enterprise_cache.EnterpriseApiClient')
-    def test_generate_diff_returns_content_items_found(self, mock_api_client):
+    def test_generate_diff_returns_content_items_found(self):
         """
         Test that the generate_diff endpoint will return under the `items_found` bucket all content keys within the
         catalog that were provided.
         """
-        mock_api_client.return_value.get_enterprise_customer.return_value = {
-            'slug': self.enterprise_slug,
-            'enable_learner_portal': True,
-            'modified': str(datetime.now().replace(tzinfo=pytz.UTC)),
-        }
         content = ContentMetadataFactory()
         content2 = ContentMetadataFactory()
         self.add_metadata_to_catalog(self.enterprise_catalog, [content, content2])
@@ -1453,35 +1420,52 @@ class EnterpriseCustomerViewSetTests(APITestMixin):
         url = self._get_generate_diff_base_url()
         response = self.client.post(
             url,
-            data=json.dumps({'content_keys': [content.content_key, content2.content_key]}),
-            content_type='application/json'
+            data={'content_keys': [content.content_key, content2.content_key]},
+            format='json',
+        )
+        self.assertCountEqual(
+            [item.get('content_key') for item in response.data.get('items_found')],
+            [content.content_key, content2.content_key],
         )
-        for item in response.data.get('items_found'):
-            assert item.get('content_key') in [content.content_key, content2.content_key]
         assert not response.data.get('items_not_found')
         assert not response.data.get('items_not_included')
 
-    @mock.patch('enterprise_catalog.apps.api_client.enterprise_cache.EnterpriseApiClient')
-    def test_generate_diff_returns_content_items_not_found(self, mock_api_client):
+    def test_generate_diff_returns_content_items_not_found(self):
         """
         Test that the generate_diff endpoint will return all content keys provided that were not found under the catalog
         under the `items_not_found` bucket.
         """
-        mock_api_client.return_value.get_enterprise_customer.return_value = {
-            'slug': self.enterprise_slug,
-            'enable_learner_portal': True,
-            'modified': str(datetime.now()),
-        }
         key = 'bad+key'
         key2 = 'bad+key2'
         url = self._get_generate_diff_base_url()
         response = self.client.post(
             url,
-            data=json.dumps({'content_keys': [key, key2]}),
-            content_type='application/json'
+            data={'content_keys': [key, key2]},
+            format='json',
         )
-        for item in response.data.get('items_not_found'):
-            assert item in [{'content_key': key}, {'content_key': key2}]
+        self.assertCountEqual(response.data.get('items_not_found'), [{'content_key': key}, {'content_key': key2}])
+        assert not response.data.get('items_found')
+        assert not response.data.get('items_not_included')
+
+    def test_generate_diff_no_catalog_query(self):
+        """
+        Test that the generate_diff endpoint returns all content keys provided under the `items_not_found` bucket when
+        the catalog has no associated catalog query.
+        """
+        no_catalog_query_catalog = EnterpriseCatalogFactory(
+            catalog_query=None,
+            enterprise_uuid=self.enterprise_uuid,
+        )
+        key = 'bad+key'
+        key2 = 'bad+key2'
+        url = self._get_generate_diff_base_url(no_catalog_query_catalog.uuid)
+        response = self.client.post(
+            url,
+            data={'content_keys': [key, key2]},
+            format='json',
+        )
+        assert response.status_code == 200
+        self.assertCountEqual(response.data.get('items_not_found'), [{'content_key': key}, {'content_key': key2}])
         assert not response.data.get('items_found')
         assert not response.data.get('items_not_included')
 
@@ -1501,7 +1485,7 @@ class EnterpriseCustomerViewSetTests(APITestMixin):
         with an incorrect JWT context (i.e., enterprise uuid)
         """
         self.remove_role_assignments()
-        base_url = self._get_contains_content_base_url(enterprise_uuid=uuid.uuid4())
+        base_url = self._get_contains_content_base_url(enterprise_uuid=_test_uuid())
         url = base_url + '?course_run_ids=fakeX'
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -1625,7 +1609,10 @@ class EnterpriseCustomerViewSetTests(APITestMixin):
 
         url = self._get_contains_content_base_url() + '?course_run_ids=' + parent_content_key + \
             '&get_catalogs_containing_specified_content_ids=True'
-        response = self.client.get(url).json()
+        # The catalogs are searched in a single query (after those authenticating the user and looking up
+        # the parents of the requested content), no matter how many catalogs the enterprise has
+        with self.assertNumQueries(3):
+            response = self.client.get(url).json()
         assert response['contains_content_items'] is True
         catalog_list = response['catalog_list']
         assert set(catalog_list) == {str(second_catalog.uuid), str(third_catalog.uuid)}
@@ -1646,6 +1633,163 @@ class EnterpriseCustomerViewSetTests(APITestMixin):
         assert catalog_list == []
 
 
+class BulkEnterpriseCatalogDiffTests(APITestMixin):
+    """
+    Tests for the bulk_generate_diff endpoint
+    """
+    url = reverse_lazy('api:v1:bulk-generate-catalog-diff')
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.patch_enterprise_api_client()
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Set up catalog.has_learner_access permissions
+        cls.create_catalog_learner()
+        # Explicit titles, as the factory's random words can collide on the unique catalog query title
+        cls.enterprise_catalog = EnterpriseCatalogFactory(
+            enterprise_uuid=cls.enterprise_uuid,
+            catalog_query=CatalogQueryFactory(title='Catalog query 1'),
+        )
+        cls.enterprise_catalog_2 = EnterpriseCatalogFactory(
+            enterprise_uuid=cls.enterprise_uuid,
+            catalog_query=CatalogQueryFactory(title='Catalog query 2'),
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.log_in_catalog_learner()
+        self.mock_api_client.reset_mock(return_value=True)
+        self.mock_api_client.return_value.get_enterprise_customer.return_value = {
+            'slug': self.enterprise_slug,
+            'enable_learner_portal': True,
+            'modified': _ENTERPRISE_CUSTOMER_MODIFIED,
+        }
+
+    def _post(self, request_json):
+        """
+        Helper to post the given json to the bulk_generate_diff endpoint
+        """
+        return self.client.post(self.url, data=request_json, format='json')
+
+    def test_bulk_generate_diff(self):
+        """
+        Test that the bulk_generate_diff endpoint returns the diff buckets of each catalog against its own content keys,
+        fetching the metadata of all catalogs and their enterprise customer only once.
+        """
+        content = ContentMetadataFactory()
+        content2 = ContentMetadataFactory()
+        content3 = ContentMetadataFactory()
+        content4 = ContentMetadataFactory()
+        self.add_metadata_to_catalog(self.enterprise_catalog, [content, content2])
+        self.add_metadata_to_catalog(self.enterprise_catalog_2, [content2, content3, content4])
+
+        # The requesting user, the catalogs, and the metadata of every catalog
+        with self.assertNumQueries(3):
+            response = self._post({
+                str(self.enterprise_catalog.uuid): [content.content_key, 'bad+key'],
+                str(self.enterprise_catalog_2.uuid): [content.content_key, content3.content_key],
+            })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.mock_api_client.return_value.get_enterprise_customer.assert_called_once()
+
+        self.assertCountEqual(response.data.keys(), [
+            str(self.enterprise_catalog.uuid),
+            str(self.enterprise_catalog_2.uuid),
+        ])
+        catalog_diff = response.data[str(self.enterprise_catalog.uuid)]
+        self.assertEqual(catalog_diff['items_not_found'], [{'content_key': 'bad+key'}])
+        self.assertEqual(catalog_diff['items_not_included'], [{'content_key': content2.content_key}])
+        self.assertEqual(catalog_diff['items_found'], [
+            {'content_key': content.content_key, 'date_updated': content.modified},
+        ])
+        catalog_2_diff = response.data[str(self.enterprise_catalog_2.uuid)]
+        self.assertEqual(catalog_2_diff['items_not_found'], [{'content_key': content.content_key}])
+        self.assertCountEqual(catalog_2_diff['items_not_included'], [
+            {'content_key': content2.content_key},
+            {'content_key': content4.content_key},
+        ])
+        self.assertEqual(catalog_2_diff['items_found'], [
+            {'content_key': content3.content_key, 'date_updated': content3.modified},
+        ])
+
+    def test_bulk_generate_diff_no_catalog_query(self):
+        """
+        Test that the bulk_generate_diff endpoint finds none of the content keys under a catalog without a catalog query
+        """
+        content = ContentMetadataFactory()
+        self.add_metadata_to_catalog(self.enterprise_catalog, [content])
+        no_catalog_query_catalog = EnterpriseCatalogFactory(
+            catalog_query=None,
+            enterprise_uuid=self.enterprise_uuid,
+        )
+
+        response = self._post({
+            str(self.enterprise_catalog.uuid): [content.content_key],
+            str(no_catalog_query_catalog.uuid): [content.content_key],
+        })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[str(self.enterprise_catalog.uuid)], {
+            'items_not_found': [],
+            'items_not_included': [],
+            'items_found': [{'content_key': content.content_key, 'date_updated': content.modified}],
+        })
+        self.assertEqual(response.data[str(no_catalog_query_catalog.uuid)], {
+            'items_not_found': [{'content_key': content.content_key}],
+            'items_not_included': [],
+            'items_found': [],
+        })
+
+    def test_bulk_generate_diff_catalog_not_found(self):
+        """
+        Test that the bulk_generate_diff endpoint 404s if any of the catalogs don't exist
+        """
+        response = self._post({
+            str(self.enterprise_catalog.uuid): [],
+            str(_test_uuid()): [],
+        })
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_bulk_generate_diff_unauthorized_incorrect_jwt_context(self):
+        """
+        Verify the bulk_generate_diff endpoint rejects catalog learners if any of the catalogs belong to another
+        enterprise, even when the rest of the catalogs are accessible
+        """
+        other_enterprise_catalog = EnterpriseCatalogFactory(catalog_query=CatalogQueryFactory(title='Catalog query 3'))
+        self.remove_role_assignments()
+        response = self._post({str(self.enterprise_catalog.uuid): []})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self._post({
+            str(self.enterprise_catalog.uuid): [],
+            str(other_enterprise_catalog.uuid): [],
+        })
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_bulk_generate_diff_invalid_request(self):
+        """
+        Test that the bulk_generate_diff endpoint rejects request bodies that don't map catalog uuids to lists of
+        content keys
+        """
+        for request_json in (
+            {},
+            [str(self.enterprise_catalog.uuid)],
+            {'not-a-uuid': []},
+            {str(self.enterprise_catalog.uuid): 'key'},
+            {str(self.enterprise_catalog.uuid): [1]},
+            {str(self.enterprise_catalog.uuid): [None]},
+            {str(self.enterprise_catalog.uuid): ['key', ['key2']]},
+            # the same catalog twice, as its uuid in both lower and upper case
+            {str(self.enterprise_catalog.uuid): ['key'], str(self.enterprise_catalog.uuid).upper(): ['key2']},
+        ):
+            with self.subTest(request_json=request_json):
+                response = self._post(request_json)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
 @ddt.ddt
 class DistinctCatalogQueriesViewTests(APITestMixin):
     """
@@ -1688,8 +1832,8 @@ class DistinctCatalogQueriesViewTests(APITestMixin):
         }
         response = self.client.post(
             self.url,
-            data=json.dumps(request_json),
-            content_type='application/json',
+            data=request_json,
+            format='json',
         ).json()
 
         if use_different_query:
@@ -17,6 +17,9 @@ from enterprise_catalog.apps.api.v1.views.default_catalog_results import (
 from enterprise_catalog.apps.api.v1.views.distinct_catalog_queries import (
     DistinctCatalogQueriesView,
 )
+from enterprise_catalog.apps.api.v1.views.enterprise_catalog_bulk_diff import (
+    BulkEnterpriseCatalogDiff,
+)
 from enterprise_catalog.apps.api.v1.views.enterprise_catalog_contains_content_items import (
     EnterpriseCatalogContainsContentItems,
 )
@@ -39,6 +42,9 @@ from enterprise_catalog.apps.api.v1.views.enterprise_customer import (
 
 app_name = 'v1'
 
+# Hyphenated catalog uuids only, so that malformed ones 404 while resolving rather than erroring in the view
+CATALOG_UUID_PATTERN = r'(?P<uuid>[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})'
+
 router = DefaultRouter()
 router.register(r'enterprise-catalogs', EnterpriseCatalogCRUDViewSet, basename='enterprise-catalog')
 router.register(r'enterprise-catalogs', EnterpriseCatalogContainsContentItems, basename='enterprise-catalog')
@@ -57,18 +63,21 @@ urlpatterns = [
     path('enterprise-catalogs/catalog_workbook', CatalogWorkbookView.as_view(),
          name='catalog-workbook'
          ),
+    path('enterprise-catalogs/bulk_generate_diff', BulkEnterpriseCatalogDiff.as_view({'post': 'post'}),
+         name='bulk-generate-catalog-diff'
+         ),
     re_path(
-        r'^enterprise-catalogs/(?P<uuid>[\S]+)/get_content_metadata',
+        rf'^enterprise-catalogs/{CATALOG_UUID_PATTERN}/get_content_metadata',
         EnterpriseCatalogGetContentMetadata.as_view({'get': 'get'}),
         name='get-content-metadata'
     ),
     re_path(
-        r'^enterprise-catalogs/(?P<uuid>[\S]+)/generate_diff',
+        rf'^enterprise-catalogs/{CATALOG_UUID_PATTERN}/generate_diff',
         EnterpriseCatalogDiff.as_view({'post': 'post'}),
         name='generate-catalog-diff'
     ),
     re_path(
-        r'^enterprise-catalogs/(?P<uuid>[\S]+)/refresh_metadata',
+        rf'^enterprise-catalogs/{CATALOG_UUID_PATTERN}/refresh_metadata',
         EnterpriseCatalogRefreshDataFromDiscovery.as_view({'post': 'post'}),
         name='update-enterprise-catalog'
     ),
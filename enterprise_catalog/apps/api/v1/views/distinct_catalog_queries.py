@@ -5,10 +5,14 @@ from edx_rest_framework_extensions.auth.jwt.authentication import (
 )
 from rest_framework import permissions
 from rest_framework.authentication import SessionAuthentication
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework.status import HTTP_200_OK
 from rest_framework.views import APIView
 
+from enterprise_catalog.apps.api.v1.parsers import ORJSONParser
+from enterprise_catalog.apps.api.v1.renderers import ORJSONRenderer
 from enterprise_catalog.apps.catalog.models import EnterpriseCatalog
 
 
@@ -22,6 +26,8 @@ class DistinctCatalogQueriesView(APIView):
     """
     authentication_classes = [JwtAuthentication, SessionAuthentication]
     permission_classes = [permissions.IsAdminUser]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    parser_classes = [ORJSONParser, FormParser, MultiPartParser]
 
     def post(self, request):
         """
@@ -0,0 +1,122 @@
+import uuid
+from collections import defaultdict
+
+import crum
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
+
+from enterprise_catalog.apps.api.v1.parsers import ORJSONParser
+from enterprise_catalog.apps.api.v1.renderers import ORJSONRenderer
+from enterprise_catalog.apps.api.v1.utils import unquote_course_keys
+from enterprise_catalog.apps.api.v1.views.base import BaseViewSet
+from enterprise_catalog.apps.api_client.enterprise_cache import (
+    EnterpriseCustomerDetails,
+)
+from enterprise_catalog.apps.catalog.models import (
+    ContentMetadataToQueries,
+    EnterpriseCatalog,
+)
+
+
+class BulkEnterpriseCatalogDiff(BaseViewSet):
+    """
+    View to generate the diffs of several enterprise catalogs against their own lists of content keys in one request
+    """
+    renderer_classes = [ORJSONRenderer]
+    parser_classes = [ORJSONParser]
+    permission_required = 'catalog.has_learner_access'
+
+    @cached_property
+    def requested_content_keys(self):
+        """
+        The content keys from the request body, by the uuid of the catalog they are to be diffed against.
+        """
+        request_data = self.request.data
+        if not request_data or not isinstance(request_data, dict):
+            raise ValidationError('bulk_generate_diff requires a mapping of catalog uuids to lists of content keys.')
+
+        requested_content_keys = {}
+        for catalog_uuid, content_keys in request_data.items():
+            try:
+                catalog_uuid = uuid.UUID(catalog_uuid)
+            except ValueError as exc:
+                raise ValidationError(f'{catalog_uuid} is not a valid catalog uuid.') from exc
+            if catalog_uuid in requested_content_keys:
+                # e.g. the same uuid given in both upper and lower case
+                raise ValidationError(f'Catalog {catalog_uuid} is given more than once.')
+            if not isinstance(content_keys, list) or not all(isinstance(key, str) for key in content_keys):
+                raise ValidationError(f'The content keys for catalog {catalog_uuid} must be a list of strings.')
+            requested_content_keys[catalog_uuid] = unquote_course_keys(content_keys)
+        return requested_content_keys
+
+    @cached_property
+    def enterprise_catalogs(self):
+        """
+        The requested enterprise catalogs, or 404ing if any of them don't exist.
+        """
+        enterprise_catalogs = list(
+            EnterpriseCatalog.objects.filter(uuid__in=self.requested_content_keys).select_related('catalog_query')
+        )
+        missing_catalog_uuids = set(self.requested_content_keys) - {catalog.uuid for catalog in enterprise_catalogs}
+        if missing_catalog_uuids:
+            raise NotFound(f"No enterprise catalogs found for: {', '.join(sorted(map(str, missing_catalog_uuids)))}")
+        return enterprise_catalogs
+
+    def check_permissions(self, request):
+        """
+        edx-rbac checks permissions against a single object, so they are checked here against the enterprise of each
+        requested catalog in turn.
+        """
+        crum.set_current_request(request)
+        for enterprise_uuid in sorted({str(catalog.enterprise_uuid) for catalog in self.enterprise_catalogs}):
+            missing_permissions = [
+                perm for perm in self.get_permission_required()
+                if not request.user.has_perm(perm, enterprise_uuid)
+            ]
+            if missing_permissions:
+                self.permission_denied(
+                    request,
+                    message=f"MISSING: {', '.join(missing_permissions)}",
+                )
+
+    def post(self, request, **kwargs):
+        """
+        Generate the diff of each requested catalog, as the generate_diff endpoint does for a single catalog.
+
+        Request Data:
+            - (dict{ str(UUID4) : list[str] }): dictionary with enterprise catalog uuids as the keys and the list of
+            content keys to diff against each catalog as the values.
+
+        Response Data:
+            - (dict{ str(UUID4) : dict }): dictionary with the requested enterprise catalog uuids as the keys and their
+            'items_not_found', 'items_not_included' and 'items_found' buckets as the values.
+        """
+        # Fetch the metadata of every requested catalog at once, rather than querying it catalog by catalog
+        content_metadata_by_catalog_query_id = defaultdict(list)
+        catalog_query_ids = {catalog.catalog_query_id for catalog in self.enterprise_catalogs if catalog.catalog_query}
+        content_metadata = ContentMetadataToQueries.objects.filter(
+            catalog_query_id__in=catalog_query_ids,
+        ).values_list('catalog_query_id', 'content_metadata__content_key', 'content_metadata__modified')
+        for catalog_query_id, content_key, modified in content_metadata:
+            content_metadata_by_catalog_query_id[catalog_query_id].append((content_key, modified))
+
+        enterprise_customers = {}
+        catalog_diffs = {}
+        for enterprise_catalog in self.enterprise_catalogs:
+            # Share the customer details between catalogs of the same enterprise, instead of loading them per catalog
+            enterprise_uuid = enterprise_catalog.enterprise_uuid
+            if enterprise_uuid not in enterprise_customers:
+                enterprise_customers[enterprise_uuid] = EnterpriseCustomerDetails(enterprise_uuid)
+            enterprise_catalog.enterprise_customer = enterprise_customers[enterprise_uuid]
+
+            items_not_found, items_not_included, items_found = enterprise_catalog.get_catalog_content_diff(
+                self.requested_content_keys[enterprise_catalog.uuid],
+                content_metadata=content_metadata_by_catalog_query_id[enterprise_catalog.catalog_query_id],
+            )
+            catalog_diffs[str(enterprise_catalog.uuid)] = {
+                'items_not_found': items_not_found,
+                'items_not_included': items_not_included,
+                'items_found': items_found,
+            }
+        return Response(catalog_diffs)
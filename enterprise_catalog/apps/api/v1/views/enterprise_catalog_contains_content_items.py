@@ -1,4 +1,5 @@
 from django.utils.decorators import method_decorator
+from django.utils.functional import cached_property
 from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.renderers import JSONRenderer
@@ -16,7 +17,7 @@ from enterprise_catalog.apps.api.v1.views.base import BaseViewSet
 from enterprise_catalog.apps.catalog.models import EnterpriseCatalog
 
 
-class EnterpriseCatalogContainsContentItems(BaseViewSet, viewsets.ReadOnlyModelViewSet):
+class EnterpriseCatalogContainsContentItems(BaseViewSet, viewsets.GenericViewSet):
     """
     View to determine if an enterprise catalog contains certain content
     """
@@ -26,6 +27,13 @@ class EnterpriseCatalogContainsContentItems(BaseViewSet, viewsets.ReadOnlyModelV
     permission_required = 'catalog.has_learner_access'
     lookup_field = 'uuid'
 
+    @cached_property
+    def enterprise_catalog(self):
+        """
+        Helper for retrieving the specified enterprise catalog once per request, or 404ing if it doesn't exist.
+        """
+        return self.get_object()
+
     def get_permission_object(self):
         """
         Retrieves the appropriate object to use during edx-rbac's permission checks.
@@ -33,8 +41,7 @@ class EnterpriseCatalogContainsContentItems(BaseViewSet, viewsets.ReadOnlyModelV
         This object is passed to the rule predicate(s).
         """
         if self.kwargs.get('uuid'):
-            enterprise_catalog = self.get_object()
-            return str(enterprise_catalog.enterprise_uuid)
+            return str(self.enterprise_catalog.enterprise_uuid)
         return None
 
     @method_decorator(require_at_least_one_query_parameter('course_run_ids', 'program_uuids'))
@@ -48,6 +55,5 @@ class EnterpriseCatalogContainsContentItems(BaseViewSet, viewsets.ReadOnlyModelV
         """
         course_run_ids = unquote_course_keys(course_run_ids)
 
-        enterprise_catalog = self.get_object()
-        contains_content_items = enterprise_catalog.contains_content_keys(course_run_ids + program_uuids)
+        contains_content_items = self.enterprise_catalog.contains_content_keys(course_run_ids + program_uuids)
         return Response({'contains_content_items': contains_content_items})
@@ -1,4 +1,5 @@
 import crum
+from django.db.models import Max, Q
 from django.utils.functional import cached_property
 from rest_framework import viewsets
 from rest_framework.renderers import JSONRenderer
@@ -79,8 +80,15 @@ class EnterpriseCatalogCRUDViewSet(BaseViewSet, viewsets.ModelViewSet):
         """
         Returns the queryset corresponding to all catalogs the requesting user has access to.
         """
-        all_catalogs = EnterpriseCatalog.objects.all().order_by('created')
+        all_catalogs = EnterpriseCatalog.objects.select_related('catalog_query').order_by('created')
         if self.request_action == 'list':
+            # Compute each catalog's `content_last_modified` in the list query rather than one aggregate per catalog
+            all_catalogs = all_catalogs.annotate(
+                content_last_modified=Max(
+                    'catalog_query__contentmetadatatoqueries__content_metadata__modified',
+                    filter=Q(catalog_query__contentmetadatatoqueries__deleted_at__isnull=True),
+                ),
+            )
             if not self.admin_accessible_enterprises:
                 return EnterpriseCatalog.objects.none()
             if has_access_to_all_enterprises(self.admin_accessible_enterprises):
@@ -1,7 +1,8 @@
 from django.utils.decorators import method_decorator
+from django.utils.functional import cached_property
 from rest_framework import viewsets
 from rest_framework.decorators import action
-from rest_framework.renderers import JSONRenderer
+from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.status import HTTP_400_BAD_REQUEST
 from rest_framework_xml.renderers import XMLRenderer
@@ -9,6 +10,8 @@ from rest_framework_xml.renderers import XMLRenderer
 from enterprise_catalog.apps.api.v1.decorators import (
     require_at_least_one_query_parameter,
 )
+from enterprise_catalog.apps.api.v1.parsers import ORJSONParser
+from enterprise_catalog.apps.api.v1.renderers import ORJSONRenderer
 from enterprise_catalog.apps.api.v1.serializers import (
     EnterpriseCatalogSerializer,
 )
@@ -22,13 +25,21 @@ class EnterpriseCatalogDiff(BaseViewSet, viewsets.ModelViewSet):
     View to determine if an enterprise catalog contains certain content
     """
     queryset = EnterpriseCatalog.objects.all().order_by('created')
-    renderer_classes = [JSONRenderer, XMLRenderer]
+    renderer_classes = [ORJSONRenderer, XMLRenderer]
+    parser_classes = [ORJSONParser, FormParser, MultiPartParser]
     serializer_class = EnterpriseCatalogSerializer
     http_method_names = ['get', 'post']
     permission_required = 'catalog.has_learner_access'
     lookup_field = 'uuid'
     MAX_GET_CONTENT_KEYS = 100
 
+    @cached_property
+    def enterprise_catalog(self):
+        """
+        Helper for retrieving the specified enterprise catalog once per request, or 404ing if it doesn't exist.
+        """
+        return self.get_object()
+
     def get_permission_object(self):
         """
         Retrieves the appropriate object to use during edx-rbac's permission checks.
@@ -36,8 +47,7 @@ class EnterpriseCatalogDiff(BaseViewSet, viewsets.ModelViewSet):
         This object is passed to the rule predicate(s).
         """
         if self.kwargs.get('uuid'):
-            enterprise_catalog = self.get_object()
-            return str(enterprise_catalog.enterprise_uuid)
+            return str(self.enterprise_catalog.enterprise_uuid)
         return None
 
     @action(detail=True)
@@ -79,8 +89,9 @@ class EnterpriseCatalogDiff(BaseViewSet, viewsets.ModelViewSet):
             content_keys param that were found under the catalog.
         """
         content_keys = unquote_course_keys(content_keys)
-        enterprise_catalog = self.get_object()
-        items_not_found, items_not_included, items_found = enterprise_catalog.get_catalog_content_diff(content_keys)
+        items_not_found, items_not_included, items_found = self.enterprise_catalog.get_catalog_content_diff(
+            content_keys
+        )
         return Response({
             'items_not_found': items_not_found,
             'items_not_included': items_not_included,
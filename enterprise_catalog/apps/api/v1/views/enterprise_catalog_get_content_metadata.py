@@ -4,7 +4,6 @@ from django.shortcuts import get_object_or_404
 from django.utils.functional import cached_property
 from rest_framework.decorators import action
 from rest_framework.generics import GenericAPIView
-from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.status import HTTP_400_BAD_REQUEST
 from rest_framework_xml.renderers import XMLRenderer
@@ -12,6 +11,7 @@ from rest_framework_xml.renderers import XMLRenderer
 from enterprise_catalog.apps.api.v1.pagination import (
     PageNumberWithSizePagination,
 )
+from enterprise_catalog.apps.api.v1.renderers import ORJSONRenderer
 from enterprise_catalog.apps.api.v1.serializers import ContentMetadataSerializer
 from enterprise_catalog.apps.api.v1.views.base import BaseViewSet
 from enterprise_catalog.apps.catalog.models import EnterpriseCatalog
@@ -23,7 +23,7 @@ class EnterpriseCatalogGetContentMetadata(BaseViewSet, GenericAPIView):
     """
     permission_required = 'catalog.has_learner_access'
     serializer_class = ContentMetadataSerializer
-    renderer_classes = [JSONRenderer, XMLRenderer]
+    renderer_classes = [ORJSONRenderer, XMLRenderer]
     lookup_field = 'uuid'
     pagination_class = PageNumberWithSizePagination
     MAX_GET_CONTENT_KEYS = 100
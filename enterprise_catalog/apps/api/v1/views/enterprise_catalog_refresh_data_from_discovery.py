@@ -1,5 +1,6 @@
 from celery import chain
 from django.shortcuts import get_object_or_404
+from django.utils.functional import cached_property
 from rest_framework.response import Response
 from rest_framework.status import HTTP_200_OK
 from rest_framework.views import APIView
@@ -19,19 +20,24 @@ class EnterpriseCatalogRefreshDataFromDiscovery(BaseViewSet, APIView):
     """
     permission_required = 'catalog.has_admin_access'
 
+    @cached_property
+    def enterprise_catalog(self):
+        """
+        Helper for retrieving the specified enterprise catalog, or 404ing if it doesn't exist.
+        """
+        uuid = self.kwargs.get('uuid')
+        return get_object_or_404(EnterpriseCatalog, uuid=uuid)
+
     def get_permission_object(self):
         """
         Retrieves the apporpriate object to use during edx-rbac's permission checks.
 
         This object is passed to the rule predicate(s).
         """
-        uuid = self.kwargs.get('uuid')
-        enterprise_catalog = get_object_or_404(EnterpriseCatalog, uuid=uuid)
-        return str(enterprise_catalog.enterprise_uuid)
+        return str(self.enterprise_catalog.enterprise_uuid)
 
-    def post(self, request, uuid):
-        enterprise_catalog = get_object_or_404(EnterpriseCatalog, uuid=uuid)
-        catalog_query_id = enterprise_catalog.catalog_query.id
+    def post(self, request, uuid):  # pylint: disable=unused-argument
+        catalog_query_id = self.enterprise_catalog.catalog_query.id
 
         # Use immutable signatures so task results from a parent task are not passed as arguments to a child task.
         async_update_metadata_chain = chain(
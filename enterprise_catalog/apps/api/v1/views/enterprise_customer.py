@@ -11,7 +11,11 @@ from enterprise_catalog.apps.api.v1.decorators import (
 )
 from enterprise_catalog.apps.api.v1.utils import unquote_course_keys
 from enterprise_catalog.apps.api.v1.views.base import BaseViewSet
-from enterprise_catalog.apps.catalog.models import EnterpriseCatalog
+from enterprise_catalog.apps.catalog.models import (
+    ContentMetadata,
+    EnterpriseCatalog,
+    get_content_keys_query,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -84,17 +88,20 @@ class EnterpriseCustomerViewSet(BaseViewSet):
         get_catalog_list = request.GET.get('get_catalog_list', False)
         course_run_ids = unquote_course_keys(course_run_ids)
 
-        customer_catalogs = EnterpriseCatalog.objects.filter(enterprise_uuid=enterprise_uuid)
-        any_catalog_contains_content_items = False
-        catalogs_that_contain_course = []
-        for catalog in customer_catalogs:
-            contains_content_items = catalog.contains_content_keys(course_run_ids + program_uuids)
-            if contains_content_items:
-                any_catalog_contains_content_items = True
-                if not (get_catalogs_containing_specified_content_ids or get_catalog_list):
-                    # Break as soon as we find a catalog that contains the specified content
-                    break
-                catalogs_that_contain_course.append(catalog.uuid)
+        # Find the customer's catalogs containing the content with a single query across all of their catalogs,
+        # rather than checking each catalog for the content one at a time
+        catalogs_that_contain_course = EnterpriseCatalog.objects.filter(
+            enterprise_uuid=enterprise_uuid,
+            catalog_query__contentmetadatatoqueries__content_metadata__in=ContentMetadata.objects.filter(
+                get_content_keys_query(course_run_ids + program_uuids),
+            ),
+            catalog_query__contentmetadatatoqueries__deleted_at__isnull=True,
+        ).values_list('uuid', flat=True).distinct()
+        if not (get_catalogs_containing_specified_content_ids or get_catalog_list):
+            any_catalog_contains_content_items = catalogs_that_contain_course.exists()
+        else:
+            catalogs_that_contain_course = list(catalogs_that_contain_course)
+            any_catalog_contains_content_items = bool(catalogs_that_contain_course)
 
         response_data = {
             'contains_content_items': any_catalog_contains_content_items,
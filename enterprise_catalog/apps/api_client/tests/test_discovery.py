@@ -22,7 +22,7 @@ class TestDiscoveryApiClient(TestCase):
             'results': [{'key': 'fakeX'}],
         }
 
-        catalog_query = CatalogQueryFactory()
+        catalog_query = CatalogQueryFactory.build()
         client = DiscoveryApiClient()
         actual_response = client.get_metadata_by_query(catalog_query)
 
@@ -38,7 +38,7 @@ class TestDiscoveryApiClient(TestCase):
         """
         mock_oauth_client.return_value.post.side_effect = JSONDecodeError('error', '{}', 0)
 
-        catalog_query = CatalogQueryFactory()
+        catalog_query = CatalogQueryFactory.build()
         client = DiscoveryApiClient()
         with self.assertRaises(JSONDecodeError):
             client.get_metadata_by_query(catalog_query)
@@ -90,6 +90,9 @@ class EnterpriseCatalogAdmin(UnchangeableMixin):
         'title',
         'get_catalog_query',
     )
+    list_select_related = (
+        'catalog_query',
+    )
     list_filter = (
         'enterprise_name',
         'catalog_query',
@@ -119,6 +122,10 @@ class EnterpriseCatalogRoleAssignmentAdmin(UserRoleAssignmentAdmin):
         'role',
         'enterprise_id',
     )
+    list_select_related = (
+        'user',
+        'role',
+    )
 
     def get_username(self, obj):
         return obj.user.username
@@ -214,13 +214,15 @@ class EnterpriseCatalog(TimeStampedModel):
         """
         return EnterpriseCustomerDetails(self.enterprise_uuid)
 
-    def get_catalog_content_diff(self, content_keys):
+    def get_catalog_content_diff(self, content_keys, content_metadata=None):
         """
         Generate a catalog diff based on a provided list of content keys and what currently exists with the catalog's
         metadata.
 
         Arguments:
             content_keys: (list) A list of string content keys used to calculate the diff on the catalog.
+            content_metadata: (iterable) Optional `(content_key, modified)` pairs of the catalog's metadata, for
+                callers that have already fetched them. Queried for when not provided.
 
         Returns:
             items_not_found: (list) A list of objects representing the content keys that were provided but not found
@@ -237,31 +239,38 @@ class EnterpriseCatalog(TimeStampedModel):
           - associated metadata contains the specified content key in a nested course run (to
             handle when a catalog only contains courses but a course run id is searched).
         """
-        found_content_keys = set()
         items_not_included = []
         items_found = []
-        items_not_found = set()
-
-        # cannot determine if specified content keys are part of catalog when a catalog query doesn't exist.
-        if not self.catalog_query:
-            return [items_not_found], items_not_included, items_found
-
         distinct_content_keys = set(content_keys)
-        for content in self.content_metadata.all().values('modified', 'content_key'):
-            content_key = content.get('content_key')
-            found_content_keys.add(content_key)
-            content_modified = get_most_recent_modified_time(
-                content.get('modified'), self.modified, self.enterprise_customer.last_modified_date
-            )
-            if content_key in distinct_content_keys:
-                items_found.append({
-                    "content_key": content_key,
-                    "date_updated": content_modified
-                })
-            else:
-                items_not_included.append({'content_key': content_key})
 
-        items_not_found = distinct_content_keys - found_content_keys
+        # cannot determine if specified content keys are part of catalog when a catalog query doesn't exist, so none of
+        # them are found under it.
+        if not self.catalog_query:
+            return [{'content_key': item} for item in distinct_content_keys], items_not_included, items_found
+
+        if content_metadata is None:
+            # Stream the rows straight into the dict below, rather than also holding them in the queryset's cache
+            content_metadata = self.content_metadata.values_list('content_key', 'modified').iterator(chunk_size=2000)
+        content_modified_times = dict(content_metadata)
+
+        if distinct_content_keys & content_modified_times.keys():
+            # The customer's modified time is parsed once for the whole diff, and only when there are items to date
+            customer_modified = self.enterprise_customer.last_modified_date
+            items_found = [
+                {
+                    'content_key': content_key,
+                    'date_updated': get_most_recent_modified_time(content_modified, self.modified, customer_modified),
+                }
+                for content_key, content_modified in content_modified_times.items()
+                if content_key in distinct_content_keys
+            ]
+        items_not_included = [
+            {'content_key': content_key}
+            for content_key in content_modified_times
+            if content_key not in distinct_content_keys
+        ]
+
+        items_not_found = distinct_content_keys - content_modified_times.keys()
         return [{'content_key': item} for item in items_not_found], items_not_included, items_found
 
     def contains_content_keys(self, content_keys):
@@ -283,28 +292,7 @@ class EnterpriseCatalog(TimeStampedModel):
         if not self.catalog_query or not content_keys:
             return False
 
-        content_keys = set(content_keys)
-
-        # construct a query on the associated catalog's content metadata to return metadata
-        # where content_key and parent_content_key matches the specified content_keys to
-        # handle the following cases where the catalog:
-        #   - contains courses and the specified content_keys are course ids
-        #   - contains course runs and the specified content_keys are course ids
-        #   - contains course runs and the specified content_keys are course run ids
-        #   - contains programs and the specified content_keys are program ids
-        query = Q(content_key__in=content_keys) | Q(parent_content_key__in=content_keys)
-
-        # retrieve content metadata objects for the specified content keys to get a set of
-        # parent content keys, i.e. course ids associated with the specified content_keys
-        # (if any) to handle the following case:
-        #   - catalog contains courses and the specified content_keys are course run ids.
-        searched_metadata = ContentMetadata.objects.filter(content_key__in=content_keys)
-        parent_content_keys = {
-            metadata.parent_content_key
-            for metadata in searched_metadata
-            if metadata.parent_content_key
-        }
-        query |= Q(content_key__in=parent_content_keys)
+        query = get_content_keys_query(content_keys)
 
         # if the filtered content metadata exists, the specified content_keys exist in the catalog
         return self.content_metadata.filter(query).exists()
@@ -561,6 +549,39 @@ def content_metadata_with_type_course():
     return content_metadata
 
 
+def get_content_keys_query(content_keys):
+    """
+    Build the query for the content metadata that contains the specified content key(s).
+
+    The query matches metadata on both its content key and its parent content key, as well as the
+    parents of any metadata with the specified content keys, such that course ids and course run ids
+    are each considered contained by catalogs with either courses or course runs.
+    """
+    content_keys = set(content_keys)
+
+    # construct a query on content metadata to return metadata where content_key and
+    # parent_content_key matches the specified content_keys to handle the following
+    # cases where the catalog:
+    #   - contains courses and the specified content_keys are course ids
+    #   - contains course runs and the specified content_keys are course ids
+    #   - contains course runs and the specified content_keys are course run ids
+    #   - contains programs and the specified content_keys are program ids
+    query = Q(content_key__in=content_keys) | Q(parent_content_key__in=content_keys)
+
+    # retrieve content metadata objects for the specified content keys to get a set of
+    # parent content keys, i.e. course ids associated with the specified content_keys
+    # (if any) to handle the following case:
+    #   - catalog contains courses and the specified content_keys are course run ids.
+    searched_metadata = ContentMetadata.objects.filter(content_key__in=content_keys)
+    parent_content_keys = {
+        metadata.parent_content_key
+        for metadata in searched_metadata
+        if metadata.parent_content_key
+    }
+    query |= Q(content_key__in=parent_content_keys)
+    return query
+
+
 def _get_defaults_from_metadata(entry, exists=False):
     """
     Given a metadata entry from course-discovery's /search/all API endpoint, this function determines the
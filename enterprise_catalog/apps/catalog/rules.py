@@ -7,10 +7,6 @@ from edx_rbac.utils import (
     request_user_has_implicit_access_via_jwt,
     user_has_access_via_database,
 )
-from edx_rest_framework_extensions.auth.jwt.authentication import (
-    get_decoded_jwt_from_auth,
-)
-from edx_rest_framework_extensions.auth.jwt.cookies import get_decoded_jwt
 
 from enterprise_catalog.apps.catalog.constants import (
     ACCESS_TO_ALL_ENTERPRISES_TOKEN,
@@ -20,7 +16,7 @@ from enterprise_catalog.apps.catalog.constants import (
 from enterprise_catalog.apps.catalog.models import (
     EnterpriseCatalogRoleAssignment,
 )
-from enterprise_catalog.apps.catalog.utils import get_jwt_roles
+from enterprise_catalog.apps.catalog.utils import get_decoded_jwt, get_jwt_roles
 
 
 @rules.predicate
@@ -34,7 +30,7 @@ def has_implicit_access_to_catalog_admin(user, context):  # pylint: disable=unus
     if not context:
         return False
     request = crum.get_current_request()
-    decoded_jwt = get_decoded_jwt(request) or get_decoded_jwt_from_auth(request)
+    decoded_jwt = get_decoded_jwt(request)
     return request_user_has_implicit_access_via_jwt(decoded_jwt, ENTERPRISE_CATALOG_ADMIN_ROLE, context)
 
 
@@ -72,7 +68,7 @@ def has_implicit_access_to_catalog_learner(user, context):  # pylint: disable=un
     if not context:
         return False
     request = crum.get_current_request()
-    decoded_jwt = get_decoded_jwt(request) or get_decoded_jwt_from_auth(request)
+    decoded_jwt = get_decoded_jwt(request)
     return request_user_has_implicit_access_via_jwt(decoded_jwt, ENTERPRISE_CATALOG_LEARNER_ROLE, context)
 
 
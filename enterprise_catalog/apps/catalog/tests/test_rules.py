@@ -151,3 +151,19 @@ class TestCatalogLearnerRBACPermissions(APITestMixin):
     def test_has_explicit_access(self, permission, get_current_request_mock):
         get_current_request_mock.return_value = self.get_request_with_jwt_cookie()
         assert self.user.has_perm(permission, str(self.enterprise_uuid))
+
+    @mock.patch('enterprise_catalog.apps.catalog.utils.get_decoded_jwt_from_cookie')
+    @mock.patch('enterprise_catalog.apps.catalog.rules.crum.get_current_request')
+    def test_jwt_decoded_once_per_request(self, get_current_request_mock, get_decoded_jwt_from_cookie_mock):
+        """
+        Verify the JWT is only decoded once per request, however many implicit access predicates check it.
+        """
+        get_current_request_mock.return_value = self.get_request_with_jwt_cookie(
+            SYSTEM_ENTERPRISE_LEARNER_ROLE,
+            uuid.uuid4(),
+        )
+        get_decoded_jwt_from_cookie_mock.return_value = {}
+        self.remove_role_assignments()
+        assert not self.user.has_perm('catalog.has_learner_access', TEST_ENTERPRISE_UUID)
+        assert not self.user.has_perm('catalog.has_learner_access', str(self.enterprise_uuid))
+        get_decoded_jwt_from_cookie_mock.assert_called_once()
@@ -19,6 +19,9 @@ from enterprise_catalog.apps.catalog.constants import COURSE_RUN
 
 LOGGER = getLogger(__name__)
 
+# Marks a request whose JWT hasn't been decoded yet, as a request without a JWT decodes to None
+_NOT_DECODED = object()
+
 
 def get_content_filter_hash(content_filter):
     content_filter_sorted_keys = json.dumps(content_filter, sort_keys=True).encode()
@@ -70,11 +73,24 @@ def get_content_type(metadata):
     return content_type
 
 
+def get_decoded_jwt(request):
+    """
+    Decodes the request's JWT from either cookies or auth payload.
+
+    The decoded JWT is kept on the request, since permission checks can need it several times within one request.
+    """
+    decoded_jwt = getattr(request, 'decoded_jwt', _NOT_DECODED)
+    if decoded_jwt is _NOT_DECODED:
+        decoded_jwt = get_decoded_jwt_from_cookie(request) or get_decoded_jwt_from_auth(request)
+        request.decoded_jwt = decoded_jwt
+    return decoded_jwt
+
+
 def get_jwt_roles(request):
     """
     Decodes the request's JWT from either cookies or auth payload and returns mapping of features roles from it.
     """
-    decoded_jwt = get_decoded_jwt_from_cookie(request) or get_decoded_jwt_from_auth(request)
+    decoded_jwt = get_decoded_jwt(request)
     if not decoded_jwt:
         return {}
     return feature_roles_from_jwt(decoded_jwt)